@@ -1,15 +0,0 @@
-
-set(target "PixelPilotApp")
-set(working_dir "/data/projects/PixelPilot")
-set(src_and_dest_list
-    "/data/projects/PixelPilot/src/ui/Main.qml"
-    "/data/projects/PixelPilot/build_clean/PixelPilot/src/ui/Main.qml"
-    "/data/projects/PixelPilot/src/ui/NodeGraph.qml"
-    "/data/projects/PixelPilot/build_clean/PixelPilot/src/ui/NodeGraph.qml"
-    "/data/projects/PixelPilot/src/ui/components/GridBackground.qml"
-    "/data/projects/PixelPilot/build_clean/PixelPilot/src/ui/components/GridBackground.qml"
-    "/data/projects/PixelPilot/src/ui/components/NodeBlock.qml"
-    "/data/projects/PixelPilot/build_clean/PixelPilot/src/ui/components/NodeBlock.qml"
-
-)
-set(timestamp_file "/data/projects/PixelPilot/build_clean/.qt/PixelPilotApp_qml.txt")
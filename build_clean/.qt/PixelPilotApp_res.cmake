@@ -1,7 +0,0 @@
-
-set(target "PixelPilotApp")
-set(working_dir "/data/projects/PixelPilot")
-set(src_and_dest_list
-
-)
-set(timestamp_file "/data/projects/PixelPilot/build_clean/.qt/PixelPilotApp_res.txt")
@@ -1,2 +0,0 @@
-set(__QT_DEPLOY_TARGET_PixelPilotApp_FILE /data/projects/PixelPilot/build_clean/PixelPilotApp)
-set(__QT_DEPLOY_TARGET_PixelPilotApp_TYPE EXECUTABLE)
@@ -1,415 +0,0 @@
-/****************************************************************************
-** Resource object code
-**
-** Created by: The Resource Compiler for Qt version 6.10.2
-**
-** WARNING! All changes made in this file will be lost!
-*****************************************************************************/
-
-#ifdef _MSC_VER
-// disable informational message "function ... selected for automatic inline expansion"
-#pragma warning (disable: 4711)
-#endif
-
-static const unsigned char qt_resource_data[] = {
-  // Main.qml
-  0x0,0x0,0x0,0xfe,
-  0x69,
-  0x6d,0x70,0x6f,0x72,0x74,0x20,0x51,0x74,0x51,0x75,0x69,0x63,0x6b,0xa,0x69,0x6d,
-  0x70,0x6f,0x72,0x74,0x20,0x51,0x74,0x51,0x75,0x69,0x63,0x6b,0x2e,0x43,0x6f,0x6e,
-  0x74,0x72,0x6f,0x6c,0x73,0xa,0xa,0x57,0x69,0x6e,0x64,0x6f,0x77,0x20,0x7b,0xa,
-  0x20,0x20,0x20,0x20,0x77,0x69,0x64,0x74,0x68,0x3a,0x20,0x31,0x30,0x32,0x34,0xa,
-  0x20,0x20,0x20,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3a,0x20,0x37,0x36,0x38,0xa,
-  0x20,0x20,0x20,0x20,0x76,0x69,0x73,0x69,0x62,0x6c,0x65,0x3a,0x20,0x74,0x72,0x75,
-  0x65,0xa,0x20,0x20,0x20,0x20,0x74,0x69,0x74,0x6c,0x65,0x3a,0x20,0x22,0x50,0x69,
-  0x78,0x65,0x6c,0x50,0x69,0x6c,0x6f,0x74,0x20,0x2d,0x20,0x57,0x61,0x79,0x6c,0x61,
-  0x6e,0x64,0x20,0x41,0x75,0x74,0x6f,0x6d,0x61,0x74,0x69,0x6f,0x6e,0x22,0xa,0x20,
-  0x20,0x20,0x20,0x63,0x6f,0x6c,0x6f,0x72,0x3a,0x20,0x22,0x23,0x32,0x64,0x32,0x64,
-  0x32,0x64,0x22,0xa,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,
-  0x4d,0x61,0x69,0x6e,0x20,0x4e,0x6f,0x64,0x65,0x47,0x72,0x61,0x70,0x68,0x20,0x63,
-  0x6f,0x6e,0x74,0x61,0x69,0x6e,0x65,0x72,0xa,0x20,0x20,0x20,0x20,0x4e,0x6f,0x64,
-  0x65,0x47,0x72,0x61,0x70,0x68,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x61,0x6e,0x63,0x68,0x6f,0x72,0x73,0x2e,0x66,0x69,0x6c,0x6c,0x3a,0x20,0x70,
-  0x61,0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x7d,0xa,0x7d,
-    // NodeGraph.qml
-  0x0,0x0,0x6,0xff,
-  0x69,
-  0x6d,0x70,0x6f,0x72,0x74,0x20,0x51,0x74,0x51,0x75,0x69,0x63,0x6b,0xa,0xa,0x49,
-  0x74,0x65,0x6d,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,0x20,0x6e,0x6f,
-  0x64,0x65,0x47,0x72,0x61,0x70,0x68,0xa,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,
-  0x20,0x2f,0x2f,0x20,0x4d,0x61,0x69,0x6e,0x20,0x63,0x6f,0x6e,0x74,0x61,0x69,0x6e,
-  0x65,0x72,0x20,0x66,0x6f,0x72,0x20,0x74,0x68,0x65,0x20,0x65,0x6e,0x74,0x69,0x72,
-  0x65,0x20,0x67,0x72,0x61,0x70,0x68,0xa,0x20,0x20,0x20,0x20,0x77,0x69,0x64,0x74,
-  0x68,0x3a,0x20,0x70,0x61,0x72,0x65,0x6e,0x74,0x2e,0x77,0x69,0x64,0x74,0x68,0xa,
-  0x20,0x20,0x20,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3a,0x20,0x70,0x61,0x72,0x65,
-  0x6e,0x74,0x2e,0x68,0x65,0x69,0x67,0x68,0x74,0xa,0x20,0x20,0x20,0x20,0xa,0x20,
-  0x20,0x20,0x20,0x2f,0x2f,0x20,0x57,0x6f,0x72,0x6c,0x64,0x20,0x69,0x74,0x65,0x6d,
-  0x20,0x74,0x68,0x61,0x74,0x20,0x63,0x61,0x6e,0x20,0x62,0x65,0x20,0x70,0x61,0x6e,
-  0x6e,0x65,0x64,0xa,0x20,0x20,0x20,0x20,0x49,0x74,0x65,0x6d,0x20,0x7b,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,0x20,0x77,0x6f,0x72,0x6c,0x64,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x77,0x69,0x64,0x74,0x68,0x3a,0x20,
-  0x70,0x61,0x72,0x65,0x6e,0x74,0x2e,0x77,0x69,0x64,0x74,0x68,0x20,0x2a,0x20,0x32,
-  0x20,0x20,0x2f,0x2f,0x20,0x4c,0x61,0x72,0x67,0x65,0x20,0x65,0x6e,0x6f,0x75,0x67,
-  0x68,0x20,0x74,0x6f,0x20,0x61,0x6c,0x6c,0x6f,0x77,0x20,0x70,0x61,0x6e,0x6e,0x69,
-  0x6e,0x67,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x68,0x65,0x69,0x67,0x68,
-  0x74,0x3a,0x20,0x70,0x61,0x72,0x65,0x6e,0x74,0x2e,0x68,0x65,0x69,0x67,0x68,0x74,
-  0x20,0x2a,0x20,0x32,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0xa,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x47,0x72,0x69,0x64,0x20,0x62,0x61,
-  0x63,0x6b,0x67,0x72,0x6f,0x75,0x6e,0x64,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x47,0x72,0x69,0x64,0x42,0x61,0x63,0x6b,0x67,0x72,0x6f,0x75,0x6e,0x64,0x20,
-  0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x61,0x6e,
-  0x63,0x68,0x6f,0x72,0x73,0x2e,0x66,0x69,0x6c,0x6c,0x3a,0x20,0x70,0x61,0x72,0x65,
-  0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,
-  0x20,0x54,0x65,0x73,0x74,0x20,0x6e,0x6f,0x64,0x65,0x20,0x31,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x4e,0x6f,0x64,0x65,0x42,0x6c,0x6f,0x63,0x6b,0x20,0x7b,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,
-  0x20,0x74,0x65,0x73,0x74,0x4e,0x6f,0x64,0x65,0x31,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x78,0x3a,0x20,0x31,0x30,0x30,0xa,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x79,0x3a,0x20,0x31,0x30,0x30,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x54,
-  0x65,0x73,0x74,0x20,0x6e,0x6f,0x64,0x65,0x20,0x32,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x4e,0x6f,0x64,0x65,0x42,0x6c,0x6f,0x63,0x6b,0x20,0x7b,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,0x20,0x74,
-  0x65,0x73,0x74,0x4e,0x6f,0x64,0x65,0x32,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x78,0x3a,0x20,0x33,0x30,0x30,0xa,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x79,0x3a,0x20,0x32,0x30,0x30,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x54,0x65,0x73,
-  0x74,0x20,0x6e,0x6f,0x64,0x65,0x20,0x33,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x4e,0x6f,0x64,0x65,0x42,0x6c,0x6f,0x63,0x6b,0x20,0x7b,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,0x20,0x74,0x65,0x73,
-  0x74,0x4e,0x6f,0x64,0x65,0x33,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x78,0x3a,0x20,0x35,0x30,0x30,0xa,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x79,0x3a,0x20,0x31,0x35,0x30,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x43,0x68,0x61,0x6e,
-  0x67,0x65,0x20,0x74,0x69,0x74,0x6c,0x65,0x20,0x74,0x6f,0x20,0x73,0x68,0x6f,0x77,
-  0x20,0x64,0x69,0x66,0x66,0x65,0x72,0x65,0x6e,0x74,0x20,0x74,0x79,0x70,0x65,0xa,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x54,0x65,0x78,0x74,
-  0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x74,0x65,0x78,0x74,0x3a,0x20,0x22,0x50,0x72,0x6f,0x63,0x65,0x73,
-  0x73,0x3a,0x20,0x46,0x69,0x6c,0x74,0x65,0x72,0x22,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x6f,0x6c,0x6f,0x72,
-  0x3a,0x20,0x22,0x77,0x68,0x69,0x74,0x65,0x22,0xa,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x66,0x6f,0x6e,0x74,0x2e,0x70,
-  0x69,0x78,0x65,0x6c,0x53,0x69,0x7a,0x65,0x3a,0x20,0x31,0x32,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x61,0x6e,0x63,
-  0x68,0x6f,0x72,0x73,0x2e,0x63,0x65,0x6e,0x74,0x65,0x72,0x49,0x6e,0x3a,0x20,0x70,
-  0x61,0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x66,0x6f,0x6e,0x74,0x2e,0x62,0x6f,0x6c,0x64,0x3a,
-  0x20,0x74,0x72,0x75,0x65,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x7a,0x3a,0x20,0x31,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0xa,0x20,0x20,
-  0x20,0x20,0x2f,0x2f,0x20,0x50,0x61,0x6e,0x20,0x66,0x75,0x6e,0x63,0x74,0x69,0x6f,
-  0x6e,0x61,0x6c,0x69,0x74,0x79,0x20,0x2d,0x20,0x63,0x6c,0x69,0x63,0x6b,0x20,0x61,
-  0x6e,0x64,0x20,0x64,0x72,0x61,0x67,0x20,0x74,0x68,0x65,0x20,0x62,0x61,0x63,0x6b,
-  0x67,0x72,0x6f,0x75,0x6e,0x64,0x20,0x74,0x6f,0x20,0x6d,0x6f,0x76,0x65,0x20,0x76,
-  0x69,0x65,0x77,0xa,0x20,0x20,0x20,0x20,0x4d,0x6f,0x75,0x73,0x65,0x41,0x72,0x65,
-  0x61,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x69,0x64,0x3a,0x20,
-  0x70,0x61,0x6e,0x4d,0x6f,0x75,0x73,0x65,0x41,0x72,0x65,0x61,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x61,0x6e,0x63,0x68,0x6f,0x72,0x73,0x2e,0x66,0x69,0x6c,
-  0x6c,0x3a,0x20,0x70,0x61,0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x64,0x72,0x61,0x67,0x2e,0x74,0x61,0x72,0x67,0x65,0x74,0x3a,0x20,0x77,
-  0x6f,0x72,0x6c,0x64,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x64,0x72,0x61,
-  0x67,0x2e,0x61,0x78,0x69,0x73,0x3a,0x20,0x44,0x72,0x61,0x67,0x2e,0x58,0x41,0x6e,
-  0x64,0x59,0x41,0x78,0x69,0x73,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x64,
-  0x72,0x61,0x67,0x2e,0x6d,0x69,0x6e,0x69,0x6d,0x75,0x6d,0x58,0x3a,0x20,0x2d,0x70,
-  0x61,0x72,0x65,0x6e,0x74,0x2e,0x77,0x69,0x64,0x74,0x68,0xa,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x64,0x72,0x61,0x67,0x2e,0x6d,0x61,0x78,0x69,0x6d,0x75,0x6d,
-  0x58,0x3a,0x20,0x30,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x64,0x72,0x61,
-  0x67,0x2e,0x6d,0x69,0x6e,0x69,0x6d,0x75,0x6d,0x59,0x3a,0x20,0x2d,0x70,0x61,0x72,
-  0x65,0x6e,0x74,0x2e,0x68,0x65,0x69,0x67,0x68,0x74,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x64,0x72,0x61,0x67,0x2e,0x6d,0x61,0x78,0x69,0x6d,0x75,0x6d,0x59,
-  0x3a,0x20,0x30,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x48,0x61,0x6e,0x64,0x6c,0x65,0x20,0x70,
-  0x61,0x6e,0x6e,0x69,0x6e,0x67,0x20,0x77,0x69,0x74,0x68,0x20,0x6d,0x6f,0x75,0x73,
-  0x65,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x6f,0x6e,0x50,0x72,0x65,0x73,
-  0x73,0x65,0x64,0x3a,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x2f,0x2f,0x20,0x43,0x61,0x70,0x74,0x75,0x72,0x65,0x20,0x74,0x68,
-  0x65,0x20,0x69,0x6e,0x69,0x74,0x69,0x61,0x6c,0x20,0x70,0x6f,0x73,0x69,0x74,0x69,
-  0x6f,0x6e,0x20,0x66,0x6f,0x72,0x20,0x70,0x61,0x6e,0x6e,0x69,0x6e,0x67,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x6f,0x6e,0x50,0x6f,0x73,0x69,
-  0x74,0x69,0x6f,0x6e,0x43,0x68,0x61,0x6e,0x67,0x65,0x64,0x3a,0x20,0x7b,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x55,0x70,
-  0x64,0x61,0x74,0x65,0x20,0x74,0x68,0x65,0x20,0x77,0x6f,0x72,0x6c,0x64,0x20,0x70,
-  0x6f,0x73,0x69,0x74,0x69,0x6f,0x6e,0x20,0x62,0x61,0x73,0x65,0x64,0x20,0x6f,0x6e,
-  0x20,0x6d,0x6f,0x75,0x73,0x65,0x20,0x6d,0x6f,0x76,0x65,0x6d,0x65,0x6e,0x74,0xa,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x7d,0xa,
-  0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x2f,0x2f,0x20,0x4f,0x70,0x74,0x69,
-  0x6f,0x6e,0x61,0x6c,0x20,0x7a,0x6f,0x6f,0x6d,0x20,0x66,0x75,0x6e,0x63,0x74,0x69,
-  0x6f,0x6e,0x61,0x6c,0x69,0x74,0x79,0x20,0x28,0x73,0x74,0x72,0x75,0x63,0x74,0x75,
-  0x72,0x65,0x20,0x72,0x65,0x61,0x64,0x79,0x29,0xa,0x20,0x20,0x20,0x20,0x2f,0x2f,
-  0x20,0x54,0x68,0x69,0x73,0x20,0x77,0x6f,0x75,0x6c,0x64,0x20,0x62,0x65,0x20,0x69,
-  0x6d,0x70,0x6c,0x65,0x6d,0x65,0x6e,0x74,0x65,0x64,0x20,0x77,0x69,0x74,0x68,0x20,
-  0x53,0x63,0x61,0x6c,0x65,0x20,0x61,0x74,0x74,0x61,0x63,0x68,0x65,0x64,0x20,0x74,
-  0x6f,0x20,0x77,0x6f,0x72,0x6c,0x64,0x20,0x69,0x74,0x65,0x6d,0xa,0x7d,
-    // GridBackground.qml
-  0x0,0x0,0x4,0x7c,
-  0x69,
-  0x6d,0x70,0x6f,0x72,0x74,0x20,0x51,0x74,0x51,0x75,0x69,0x63,0x6b,0xa,0xa,0x49,
-  0x74,0x65,0x6d,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x77,0x69,0x64,0x74,0x68,0x3a,
-  0x20,0x70,0x61,0x72,0x65,0x6e,0x74,0x2e,0x77,0x69,0x64,0x74,0x68,0xa,0x20,0x20,
-  0x20,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3a,0x20,0x70,0x61,0x72,0x65,0x6e,0x74,
-  0x2e,0x68,0x65,0x69,0x67,0x68,0x74,0xa,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,
-  0x20,0x2f,0x2f,0x20,0x44,0x61,0x72,0x6b,0x20,0x67,0x72,0x61,0x79,0x20,0x62,0x61,
-  0x63,0x6b,0x67,0x72,0x6f,0x75,0x6e,0x64,0xa,0x20,0x20,0x20,0x20,0x52,0x65,0x63,
-  0x74,0x61,0x6e,0x67,0x6c,0x65,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x61,0x6e,0x63,0x68,0x6f,0x72,0x73,0x2e,0x66,0x69,0x6c,0x6c,0x3a,0x20,0x70,
-  0x61,0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x6f,
-  0x6c,0x6f,0x72,0x3a,0x20,0x22,0x23,0x31,0x65,0x31,0x65,0x31,0x65,0x22,0xa,0x20,
-  0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x2f,0x2f,
-  0x20,0x47,0x72,0x69,0x64,0x20,0x70,0x61,0x74,0x74,0x65,0x72,0x6e,0x20,0x75,0x73,
-  0x69,0x6e,0x67,0x20,0x43,0x61,0x6e,0x76,0x61,0x73,0xa,0x20,0x20,0x20,0x20,0x43,
-  0x61,0x6e,0x76,0x61,0x73,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x61,0x6e,0x63,0x68,0x6f,0x72,0x73,0x2e,0x66,0x69,0x6c,0x6c,0x3a,0x20,0x70,0x61,
-  0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x6f,0x6e,0x50,
-  0x61,0x69,0x6e,0x74,0x3a,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x76,0x61,0x72,0x20,0x63,0x74,0x78,0x20,0x3d,0x20,0x63,0x61,
-  0x6e,0x76,0x61,0x73,0x2e,0x63,0x6f,0x6e,0x74,0x65,0x78,0x74,0xa,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x72,0x65,0x73,
-  0x65,0x74,0x28,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,0x2f,
-  0x20,0x53,0x65,0x74,0x20,0x67,0x72,0x69,0x64,0x20,0x70,0x72,0x6f,0x70,0x65,0x72,
-  0x74,0x69,0x65,0x73,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x76,0x61,0x72,0x20,0x67,0x72,0x69,0x64,0x53,0x69,0x7a,0x65,0x20,0x3d,0x20,
-  0x32,0x30,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x76,
-  0x61,0x72,0x20,0x6c,0x69,0x6e,0x65,0x43,0x6f,0x6c,0x6f,0x72,0x20,0x3d,0x20,0x22,
-  0x23,0x33,0x65,0x33,0x65,0x33,0x65,0x22,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x2f,0x2f,0x20,0x44,0x72,0x61,0x77,0x20,0x76,0x65,0x72,0x74,0x69,0x63,
-  0x61,0x6c,0x20,0x6c,0x69,0x6e,0x65,0x73,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x73,0x74,0x72,0x6f,0x6b,0x65,0x53,
-  0x74,0x79,0x6c,0x65,0x20,0x3d,0x20,0x6c,0x69,0x6e,0x65,0x43,0x6f,0x6c,0x6f,0x72,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,
-  0x2e,0x6c,0x69,0x6e,0x65,0x57,0x69,0x64,0x74,0x68,0x20,0x3d,0x20,0x31,0xa,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x66,0x6f,0x72,0x20,0x28,0x76,0x61,0x72,
-  0x20,0x78,0x20,0x3d,0x20,0x30,0x3b,0x20,0x78,0x20,0x3c,0x20,0x77,0x69,0x64,0x74,
-  0x68,0x3b,0x20,0x78,0x20,0x2b,0x3d,0x20,0x67,0x72,0x69,0x64,0x53,0x69,0x7a,0x65,
-  0x29,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x62,0x65,0x67,0x69,0x6e,0x50,0x61,0x74,
-  0x68,0x28,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x6d,0x6f,0x76,0x65,0x54,0x6f,0x28,0x78,
-  0x2c,0x20,0x30,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x6c,0x69,0x6e,0x65,0x54,0x6f,0x28,
-  0x78,0x2c,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x29,0xa,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x73,
-  0x74,0x72,0x6f,0x6b,0x65,0x28,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x2f,
-  0x2f,0x20,0x44,0x72,0x61,0x77,0x20,0x68,0x6f,0x72,0x69,0x7a,0x6f,0x6e,0x74,0x61,
-  0x6c,0x20,0x6c,0x69,0x6e,0x65,0x73,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x66,0x6f,0x72,0x20,0x28,0x76,0x61,0x72,0x20,0x79,0x20,0x3d,
-  0x20,0x30,0x3b,0x20,0x79,0x20,0x3c,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3b,0x20,
-  0x79,0x20,0x2b,0x3d,0x20,0x67,0x72,0x69,0x64,0x53,0x69,0x7a,0x65,0x29,0x20,0x7b,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x63,0x74,0x78,0x2e,0x62,0x65,0x67,0x69,0x6e,0x50,0x61,0x74,0x68,0x28,0x29,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x63,0x74,0x78,0x2e,0x6d,0x6f,0x76,0x65,0x54,0x6f,0x28,0x30,0x2c,0x20,0x79,
-  0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x63,0x74,0x78,0x2e,0x6c,0x69,0x6e,0x65,0x54,0x6f,0x28,0x77,0x69,0x64,
-  0x74,0x68,0x2c,0x20,0x79,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x74,0x78,0x2e,0x73,0x74,0x72,0x6f,0x6b,
-  0x65,0x28,0x29,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x7d,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x7d,0xa,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x6f,0x6e,0x57,
-  0x69,0x64,0x74,0x68,0x43,0x68,0x61,0x6e,0x67,0x65,0x64,0x3a,0x20,0x72,0x65,0x71,
-  0x75,0x65,0x73,0x74,0x50,0x61,0x69,0x6e,0x74,0x28,0x29,0xa,0x20,0x20,0x20,0x20,
-  0x20,0x20,0x20,0x20,0x6f,0x6e,0x48,0x65,0x69,0x67,0x68,0x74,0x43,0x68,0x61,0x6e,
-  0x67,0x65,0x64,0x3a,0x20,0x72,0x65,0x71,0x75,0x65,0x73,0x74,0x50,0x61,0x69,0x6e,
-  0x74,0x28,0x29,0xa,0x20,0x20,0x20,0x20,0x7d,0xa,0x7d,
-    // NodeBlock.qml
-  0x0,0x0,0x2,0x90,
-  0x28,
-  0xb5,0x2f,0xfd,0x60,0xa1,0x7,0x35,0x14,0x0,0xc6,0x5a,0x4f,0x1f,0x10,0x77,0x73,
-  0x26,0x70,0x94,0x64,0x8d,0xb6,0x97,0xb4,0xcd,0x64,0xd7,0xab,0x6,0x72,0x82,0xf6,
-  0x2f,0x57,0xca,0x13,0xca,0x41,0x36,0x22,0x0,0x8,0xe0,0x68,0x45,0x0,0x46,0x0,
-  0x46,0x0,0xaf,0xe6,0x94,0x97,0x41,0xc4,0x35,0x3e,0xea,0x2c,0x8f,0x88,0x97,0x72,
-  0x7d,0x87,0xb,0xe9,0x56,0xf9,0xb1,0x77,0x62,0xd4,0xf5,0x5b,0x3e,0x95,0x4e,0xf3,
-  0xc3,0x1,0xf2,0xaa,0x23,0x26,0x37,0x22,0x1c,0x89,0x57,0xb1,0xa1,0x24,0x85,0x5e,
-  0x9d,0x94,0x85,0x95,0xbe,0x82,0xf2,0x0,0xd4,0xb3,0xed,0xc,0x0,0x10,0x7a,0x72,
-  0xeb,0x74,0xe7,0xcd,0x55,0xcb,0x64,0x1a,0xcd,0xf4,0xce,0x96,0xdd,0xa5,0x5,0x71,
-  0x5f,0x3b,0xb5,0xda,0x1b,0xfb,0x18,0x95,0xf1,0xb5,0xcb,0xee,0xa1,0x4,0x1c,0xb,
-  0x79,0x30,0x16,0xd,0x5,0x3b,0x4a,0x9c,0x9b,0xbb,0x16,0xde,0x64,0x7d,0xb7,0x69,
-  0xbd,0x70,0x76,0xd6,0xdd,0x62,0x1a,0x6,0x5e,0xc8,0xd5,0xa,0x40,0x85,0x20,0xf0,
-  0x8a,0xeb,0xac,0xf,0xf2,0x4a,0xb4,0x49,0xe8,0x98,0x2e,0x3b,0x2d,0xd9,0x5b,0x7e,
-  0x43,0x2e,0x7b,0xed,0xbb,0x43,0x38,0xf9,0xe1,0x95,0xe9,0x9e,0x6c,0xde,0x91,0xa3,
-  0xf0,0x8a,0x4a,0x8c,0x9d,0x86,0xeb,0x75,0xba,0xcb,0x17,0x44,0xe3,0x72,0x8f,0xe1,
-  0xe0,0x48,0xc2,0xe0,0x80,0xd4,0x6e,0x3c,0xab,0x45,0x33,0xbc,0x4d,0xf7,0x29,0x12,
-  0xaf,0xf6,0x24,0x3f,0x73,0x4b,0x52,0x33,0x34,0xad,0xd7,0xb6,0x8c,0x24,0x4f,0x65,
-  0xf3,0xaa,0xb7,0xa9,0xc2,0xe9,0xd3,0x65,0x5c,0xfb,0x94,0xb7,0x5e,0xcf,0x8a,0xe6,
-  0x1e,0xa3,0x1b,0x49,0x6f,0x5a,0xf9,0x7a,0x65,0x44,0xe2,0x92,0x9f,0xc,0x4,0x37,
-  0xf8,0x55,0xc1,0x58,0xd9,0x91,0xec,0x37,0xa1,0xb5,0xb7,0x21,0x66,0x54,0x33,0xde,
-  0x9,0xa9,0x8b,0xc7,0x1c,0x5b,0x16,0xa3,0x8e,0x37,0x8,0x48,0xe4,0xba,0x7a,0xab,
-  0xbd,0x6d,0xa6,0x25,0x45,0x72,0xf4,0xe5,0x1a,0x80,0x91,0xa8,0xf1,0xa9,0x29,0x19,
-  0x19,0x99,0x49,0x4a,0x92,0xe,0x30,0x84,0x10,0xe5,0x50,0x59,0x7,0xc2,0x60,0x5c,
-  0x12,0x82,0xd8,0x48,0x80,0x8c,0x14,0x90,0x24,0xc1,0x98,0xf2,0x28,0x29,0x2d,0x65,
-  0x19,0x3,0x5d,0x20,0x56,0x12,0x58,0x3e,0x23,0xc4,0x0,0xda,0x26,0xa1,0xe5,0x96,
-  0x45,0x36,0x1d,0xe1,0xa5,0x5f,0xac,0x6a,0xf1,0x28,0x93,0xe,0x40,0xef,0x8,0xc9,
-  0xe2,0x27,0x63,0x6a,0xa8,0xd6,0xf4,0x78,0x25,0xcf,0x77,0x6,0x58,0x85,0x5b,0x65,
-  0xbf,0xcd,0x44,0x54,0x92,0xf8,0xaa,0x82,0x11,0x7,0xdb,0x6f,0x72,0xf8,0x8d,0xdc,
-  0x76,0x5b,0x52,0x95,0x79,0xb9,0x8f,0xdb,0xb5,0x21,0xf0,0x82,0x6a,0xeb,0x68,0x56,
-  0x47,0xfa,0xa3,0x38,0xf5,0xc5,0xa6,0xd,0xfd,0x41,0x52,0xc,0x42,0x3d,0xa4,0xf8,
-  0x28,0x3e,0x25,0x7f,0xd2,0xe5,0xb,0x70,0xe5,0x24,0x59,0xb4,0xa6,0xc9,0xfb,0x3c,
-  0x46,0x4a,0x3f,0x5e,0x87,0x3d,0xb1,0x5f,0x9e,0x48,0x40,0x4f,0xeb,0x8d,0x51,0x51,
-  0x93,0x61,0x9c,0xc3,0x47,0x0,0xf7,0xcf,0xee,0xc4,0x4d,0x3,0x54,0x8,0xb3,0x7,
-  0x46,0xd7,0xf2,0x10,0x7a,0x79,0xf4,0xb0,0xdd,0x36,0xee,0x81,0x12,0x52,0xbc,0x4b,
-  0xd7,0x62,0xce,0x51,0xc1,0x4e,0x94,0x2e,0xf7,0x2c,0x90,0x4c,0xb8,0x17,0x1c,0x1d,
-  0x5b,0x2a,0x38,0x0,0x5,0x3d,0xe8,0x17,0x17,0x6b,0x25,0x51,0x7d,0x4d,0x4b,0xa0,
-  0x33,0xe2,0x7a,0x4,0x9f,0x33,0x95,0x5b,0x57,0x60,0x33,0xe,0x3f,0xb6,0xf4,0x26,
-  0x67,0x8b,0x2,0xda,0xa8,0x88,0x32,0xbd,0x30,0x75,0x77,0xd7,0xe0,0xcb,0xb7,0x60,
-  0x68,0x15,0x76,0x7f,0x2f,0x2f,0x1d,0x31,0x26,0x52,0x62,0x6b,0xbd,0xbe,0x78,0xb1,
-  0xfe,0x31,0xa,0x8f,0x21,0xb5,0x0,0xaa,0x1d,0x5f,0x27,0xd8,0xf1,0xc6,0xea,0xea,
-  0x2a,0xaa,0xb0,0xf8,0x2c,0xe9,0x0,0x6a,0xe2,0x88,0xcf,0x82,0x8f,0x66,0xde,0x5c,
-  0x87,0x8a,0x8d,0x10,0xd,0xe5,0x12,0xa,0x54,0x50,0x68,0x9f,0xf5,0xad,0x2,
-  
-};
-
-static const unsigned char qt_resource_name[] = {
-  // PixelPilot
-  0x0,0xa,
-  0xc,0x1c,0x22,0xa4,
-  0x0,0x50,
-  0x0,0x69,0x0,0x78,0x0,0x65,0x0,0x6c,0x0,0x50,0x0,0x69,0x0,0x6c,0x0,0x6f,0x0,0x74,
-    // src
-  0x0,0x3,
-  0x0,0x0,0x7a,0x83,
-  0x0,0x73,
-  0x0,0x72,0x0,0x63,
-    // ui
-  0x0,0x2,
-  0x0,0x0,0x7,0xb9,
-  0x0,0x75,
-  0x0,0x69,
-    // Main.qml
-  0x0,0x8,
-  0x8,0x1,0x5e,0x5c,
-  0x0,0x4d,
-  0x0,0x61,0x0,0x69,0x0,0x6e,0x0,0x2e,0x0,0x71,0x0,0x6d,0x0,0x6c,
-    // components
-  0x0,0xa,
-  0x7,0x6a,0x9,0x33,
-  0x0,0x63,
-  0x0,0x6f,0x0,0x6d,0x0,0x70,0x0,0x6f,0x0,0x6e,0x0,0x65,0x0,0x6e,0x0,0x74,0x0,0x73,
-    // NodeGraph.qml
-  0x0,0xd,
-  0x2,0xde,0x6c,0x7c,
-  0x0,0x4e,
-  0x0,0x6f,0x0,0x64,0x0,0x65,0x0,0x47,0x0,0x72,0x0,0x61,0x0,0x70,0x0,0x68,0x0,0x2e,0x0,0x71,0x0,0x6d,0x0,0x6c,
-    // GridBackground.qml
-  0x0,0x12,
-  0x8,0xa7,0x68,0xdc,
-  0x0,0x47,
-  0x0,0x72,0x0,0x69,0x0,0x64,0x0,0x42,0x0,0x61,0x0,0x63,0x0,0x6b,0x0,0x67,0x0,0x72,0x0,0x6f,0x0,0x75,0x0,0x6e,0x0,0x64,0x0,0x2e,0x0,0x71,0x0,0x6d,
-  0x0,0x6c,
-    // NodeBlock.qml
-  0x0,0xd,
-  0xf,0x2b,0x67,0x1c,
-  0x0,0x4e,
-  0x0,0x6f,0x0,0x64,0x0,0x65,0x0,0x42,0x0,0x6c,0x0,0x6f,0x0,0x63,0x0,0x6b,0x0,0x2e,0x0,0x71,0x0,0x6d,0x0,0x6c,
-  
-};
-
-static const unsigned char qt_resource_struct[] = {
-  // :
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/PixelPilot
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x2,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/PixelPilot/src
-  0x0,0x0,0x0,0x1a,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x3,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/PixelPilot/src/ui
-  0x0,0x0,0x0,0x26,0x0,0x2,0x0,0x0,0x0,0x3,0x0,0x0,0x0,0x4,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/PixelPilot/src/ui/NodeGraph.qml
-  0x0,0x0,0x0,0x60,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x1,0x2,
-0x0,0x0,0x1,0x9c,0x23,0xc2,0x79,0x61,
-  // :/PixelPilot/src/ui/components
-  0x0,0x0,0x0,0x46,0x0,0x2,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x7,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/PixelPilot/src/ui/Main.qml
-  0x0,0x0,0x0,0x30,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x1,0x9c,0x23,0xc2,0xaa,0xd9,
-  // :/PixelPilot/src/ui/components/GridBackground.qml
-  0x0,0x0,0x0,0x80,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x8,0x5,
-0x0,0x0,0x1,0x9c,0x23,0xc1,0x1d,0x8c,
-  // :/PixelPilot/src/ui/components/NodeBlock.qml
-  0x0,0x0,0x0,0xaa,0x0,0x4,0x0,0x0,0x0,0x1,0x0,0x0,0xc,0x85,
-0x0,0x0,0x1,0x9c,0x23,0xc1,0xe7,0x1,
-
-};
-
-#ifdef QT_NAMESPACE
-#  define QT_RCC_PREPEND_NAMESPACE(name) ::QT_NAMESPACE::name
-#  define QT_RCC_MANGLE_NAMESPACE0(x) x
-#  define QT_RCC_MANGLE_NAMESPACE1(a, b) a##_##b
-#  define QT_RCC_MANGLE_NAMESPACE2(a, b) QT_RCC_MANGLE_NAMESPACE1(a,b)
-#  define QT_RCC_MANGLE_NAMESPACE(name) QT_RCC_MANGLE_NAMESPACE2( \
-        QT_RCC_MANGLE_NAMESPACE0(name), QT_RCC_MANGLE_NAMESPACE0(QT_NAMESPACE))
-#else
-#   define QT_RCC_PREPEND_NAMESPACE(name) name
-#   define QT_RCC_MANGLE_NAMESPACE(name) name
-#endif
-
-#if defined(QT_INLINE_NAMESPACE)
-inline namespace QT_NAMESPACE {
-#elif defined(QT_NAMESPACE)
-namespace QT_NAMESPACE {
-#endif
-
-bool qRegisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-bool qUnregisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-
-#if defined(__ELF__) || defined(__APPLE__)
-static inline unsigned char qResourceFeatureZstd()
-{
-    extern const unsigned char qt_resourceFeatureZstd;
-    return qt_resourceFeatureZstd;
-}
-#else
-unsigned char qResourceFeatureZstd();
-#endif
-
-#ifdef QT_NAMESPACE
-}
-#endif
-
-int QT_RCC_MANGLE_NAMESPACE(qInitResources_PixelPilotApp_raw_qml_0)();
-int QT_RCC_MANGLE_NAMESPACE(qInitResources_PixelPilotApp_raw_qml_0)()
-{
-    int version = 3;
-    QT_RCC_PREPEND_NAMESPACE(qRegisterResourceData)
-        (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources_PixelPilotApp_raw_qml_0)();
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources_PixelPilotApp_raw_qml_0)()
-{
-    int version = 3;
-    version += QT_RCC_PREPEND_NAMESPACE(qResourceFeatureZstd());
-    QT_RCC_PREPEND_NAMESPACE(qUnregisterResourceData)
-       (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic push
-#   pragma clang diagnostic ignored "-Wexit-time-destructors"
-#endif
-
-namespace {
-   struct initializer {
-       initializer() { QT_RCC_MANGLE_NAMESPACE(qInitResources_PixelPilotApp_raw_qml_0)(); }
-       ~initializer() { QT_RCC_MANGLE_NAMESPACE(qCleanupResources_PixelPilotApp_raw_qml_0)(); }
-   } dummy;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic pop
-#endif
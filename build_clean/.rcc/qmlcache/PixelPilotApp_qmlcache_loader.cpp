@@ -1,82 +0,0 @@
-#include <QtQml/qqmlprivate.h>
-#include <QtCore/qdir.h>
-#include <QtCore/qurl.h>
-#include <QtCore/qhash.h>
-#include <QtCore/qstring.h>
-
-namespace QmlCacheGeneratedCode {
-namespace _0x5f_PixelPilot_src_ui_Main_qml { 
-    extern const unsigned char qmlData[];
-    extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-    const QQmlPrivate::CachedQmlUnit unit = {
-        reinterpret_cast<const QV4::CompiledData::Unit*>(&qmlData), &aotBuiltFunctions[0], nullptr
-    };
-}
-namespace _0x5f_PixelPilot_src_ui_NodeGraph_qml { 
-    extern const unsigned char qmlData[];
-    extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-    const QQmlPrivate::CachedQmlUnit unit = {
-        reinterpret_cast<const QV4::CompiledData::Unit*>(&qmlData), &aotBuiltFunctions[0], nullptr
-    };
-}
-namespace _0x5f_PixelPilot_src_ui_components_GridBackground_qml { 
-    extern const unsigned char qmlData[];
-    extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-    const QQmlPrivate::CachedQmlUnit unit = {
-        reinterpret_cast<const QV4::CompiledData::Unit*>(&qmlData), &aotBuiltFunctions[0], nullptr
-    };
-}
-namespace _0x5f_PixelPilot_src_ui_components_NodeBlock_qml { 
-    extern const unsigned char qmlData[];
-    extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-    const QQmlPrivate::CachedQmlUnit unit = {
-        reinterpret_cast<const QV4::CompiledData::Unit*>(&qmlData), &aotBuiltFunctions[0], nullptr
-    };
-}
-
-}
-namespace {
-struct Registry {
-    Registry();
-    ~Registry();
-    QHash<QString, const QQmlPrivate::CachedQmlUnit*> resourcePathToCachedUnit;
-    static const QQmlPrivate::CachedQmlUnit *lookupCachedUnit(const QUrl &url);
-};
-
-Q_GLOBAL_STATIC(Registry, unitRegistry)
-
-
-Registry::Registry() {
-    resourcePathToCachedUnit.insert(QStringLiteral("/PixelPilot/src/ui/Main.qml"), &QmlCacheGeneratedCode::_0x5f_PixelPilot_src_ui_Main_qml::unit);
-    resourcePathToCachedUnit.insert(QStringLiteral("/PixelPilot/src/ui/NodeGraph.qml"), &QmlCacheGeneratedCode::_0x5f_PixelPilot_src_ui_NodeGraph_qml::unit);
-    resourcePathToCachedUnit.insert(QStringLiteral("/PixelPilot/src/ui/components/GridBackground.qml"), &QmlCacheGeneratedCode::_0x5f_PixelPilot_src_ui_components_GridBackground_qml::unit);
-    resourcePathToCachedUnit.insert(QStringLiteral("/PixelPilot/src/ui/components/NodeBlock.qml"), &QmlCacheGeneratedCode::_0x5f_PixelPilot_src_ui_components_NodeBlock_qml::unit);
-    QQmlPrivate::RegisterQmlUnitCacheHook registration;
-    registration.structVersion = 0;
-    registration.lookupCachedQmlUnit = &lookupCachedUnit;
-    QQmlPrivate::qmlregister(QQmlPrivate::QmlUnitCacheHookRegistration, &registration);
-}
-
-Registry::~Registry() {
-    QQmlPrivate::qmlunregister(QQmlPrivate::QmlUnitCacheHookRegistration, quintptr(&lookupCachedUnit));
-}
-
-const QQmlPrivate::CachedQmlUnit *Registry::lookupCachedUnit(const QUrl &url) {
-    if (url.scheme() != QLatin1String("qrc"))
-        return nullptr;
-    QString resourcePath = QDir::cleanPath(url.path());
-    if (resourcePath.isEmpty())
-        return nullptr;
-    if (!resourcePath.startsWith(QLatin1Char('/')))
-        resourcePath.prepend(QLatin1Char('/'));
-    return unitRegistry()->resourcePathToCachedUnit.value(resourcePath, nullptr);
-}
-}
-int QT_MANGLE_NAMESPACE(qInitResources_qmlcache_PixelPilotApp)() {
-    ::unitRegistry();
-    return 1;
-}
-Q_CONSTRUCTOR_FUNCTION(QT_MANGLE_NAMESPACE(qInitResources_qmlcache_PixelPilotApp))
-int QT_MANGLE_NAMESPACE(qCleanupResources_qmlcache_PixelPilotApp)() {
-    return 1;
-}
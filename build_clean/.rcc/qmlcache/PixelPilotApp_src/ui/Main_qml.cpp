@@ -1,244 +0,0 @@
-// /PixelPilot/src/ui/Main.qml
-#include <QtQml/qqmlprivate.h>
-#include <QtCore/qdatetime.h>
-#include <QtCore/qobject.h>
-#include <QtCore/qstring.h>
-#include <QtCore/qstringlist.h>
-#include <QtCore/qtimezone.h>
-#include <QtCore/qurl.h>
-#include <QtCore/qvariant.h>
-#include <QtQml/qjsengine.h>
-#include <QtQml/qjsprimitivevalue.h>
-#include <QtQml/qjsvalue.h>
-#include <QtQml/qqmlcomponent.h>
-#include <QtQml/qqmlcontext.h>
-#include <QtQml/qqmlengine.h>
-#include <QtQml/qqmllist.h>
-#include <type_traits>
-namespace QmlCacheGeneratedCode {
-namespace _0x5f_PixelPilot_src_ui_Main_qml {
-extern const unsigned char qmlData alignas(16) [];
-extern const unsigned char qmlData alignas(16) [] = {
-
-0x71,0x76,0x34,0x63,0x64,0x61,0x74,0x61,
-0x48,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x24,0x5,0x0,0x0,0x52,0x93,0x5b,0x9a,
-0x3,0xa2,0x2d,0xb,0x99,0xca,0x8a,0x61,
-0x6f,0xe9,0x77,0xe0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x23,0x0,0x0,0x0,
-0x10,0x0,0x0,0x0,0x30,0x1,0x0,0x0,
-0x1,0x0,0x0,0x0,0xc8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xd0,0x0,0x0,0x0,
-0x2,0x0,0x0,0x0,0xd0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe0,0x0,0x0,0x0,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x18,0x3,0x0,0x0,
-0xe0,0x0,0x0,0x0,0xf3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x40,0x65,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0x7d,0x3f,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xe,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0xd,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x0,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x70,0x1,0x0,0x0,0x78,0x1,0x0,0x0,
-0x90,0x1,0x0,0x0,0xb8,0x1,0x0,0x0,
-0xd0,0x1,0x0,0x0,0xe0,0x1,0x0,0x0,
-0xf8,0x1,0x0,0x0,0x10,0x2,0x0,0x0,
-0x20,0x2,0x0,0x0,0x68,0x2,0x0,0x0,
-0x78,0x2,0x0,0x0,0x90,0x2,0x0,0x0,
-0xa8,0x2,0x0,0x0,0xc0,0x2,0x0,0x0,
-0xd0,0x2,0x0,0x0,0x0,0x3,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x51,0x0,0x74,0x0,
-0x51,0x0,0x75,0x0,0x69,0x0,0x63,0x0,
-0x6b,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x10,0x0,0x0,0x0,0x51,0x0,0x74,0x0,
-0x51,0x0,0x75,0x0,0x69,0x0,0x63,0x0,
-0x6b,0x0,0x2e,0x0,0x43,0x0,0x6f,0x0,
-0x6e,0x0,0x74,0x0,0x72,0x0,0x6f,0x0,
-0x6c,0x0,0x73,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x57,0x0,0x69,0x0,
-0x6e,0x0,0x64,0x0,0x6f,0x0,0x77,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x69,0x0,
-0x64,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x68,0x0,0x65,0x0,
-0x69,0x0,0x67,0x0,0x68,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x76,0x0,0x69,0x0,
-0x73,0x0,0x69,0x0,0x62,0x0,0x6c,0x0,
-0x65,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x74,0x0,0x69,0x0,
-0x74,0x0,0x6c,0x0,0x65,0x0,0x0,0x0,
-0x1f,0x0,0x0,0x0,0x50,0x0,0x69,0x0,
-0x78,0x0,0x65,0x0,0x6c,0x0,0x50,0x0,
-0x69,0x0,0x6c,0x0,0x6f,0x0,0x74,0x0,
-0x20,0x0,0x2d,0x0,0x20,0x0,0x57,0x0,
-0x61,0x0,0x79,0x0,0x6c,0x0,0x61,0x0,
-0x6e,0x0,0x64,0x0,0x20,0x0,0x41,0x0,
-0x75,0x0,0x74,0x0,0x6f,0x0,0x6d,0x0,
-0x61,0x0,0x74,0x0,0x69,0x0,0x6f,0x0,
-0x6e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x63,0x0,0x6f,0x0,
-0x6c,0x0,0x6f,0x0,0x72,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x32,0x0,
-0x64,0x0,0x32,0x0,0x64,0x0,0x32,0x0,
-0x64,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x4e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x47,0x0,0x72,0x0,
-0x61,0x0,0x70,0x0,0x68,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x61,0x0,0x6e,0x0,
-0x63,0x0,0x68,0x0,0x6f,0x0,0x72,0x0,
-0x73,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x69,0x0,
-0x6c,0x0,0x6c,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x66,0x0,0x69,0x0,0x6c,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x70,0x0,0x61,0x0,
-0x72,0x0,0x65,0x0,0x6e,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x3,0x0,0x0,0x0,0x38,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x10,0x0,
-0xff,0xff,0x0,0x0,0x1,0x0,0x0,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2,0x0,0x10,0x0,0xff,0xff,0x0,0x0,
-0x44,0x0,0x0,0x0,0x2c,0x1,0x0,0x0,
-0x9c,0x1,0x0,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x6,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x4,0x0,0x10,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0xa,0x0,0x0,0x0,
-0x9,0x0,0x50,0x0,0x9,0x0,0xc0,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x8,0x0,0x50,0x0,0x8,0x0,0xc0,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x50,0x0,0x7,0x0,0xe0,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x50,0x0,0x6,0x0,0xd0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x50,0x0,0x5,0x0,0xc0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x50,0x0,0xc,0x0,0x50,0x0,
-0x0,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x1,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0xc,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xd,0x0,0x90,0x0,0xd,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x1,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0xd,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xd,0x0,0x10,0x1,0xd,0x0,0x70,0x1,
-0x0,0x0,0x0,0x0
-};
-QT_WARNING_PUSH
-QT_WARNING_DISABLE_MSVC(4573)
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[] = {
-{ 0, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for fill at line 13, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(0, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 0, 0, nullptr, nullptr }};
-QT_WARNING_POP
-}
-}
@@ -1,1396 +0,0 @@
-// /PixelPilot/src/ui/NodeGraph.qml
-#include <QtQml/qqmlprivate.h>
-#include <QtCore/qdatetime.h>
-#include <QtCore/qobject.h>
-#include <QtCore/qstring.h>
-#include <QtCore/qstringlist.h>
-#include <QtCore/qtimezone.h>
-#include <QtCore/qurl.h>
-#include <QtCore/qvariant.h>
-#include <QtQml/qjsengine.h>
-#include <QtQml/qjsprimitivevalue.h>
-#include <QtQml/qjsvalue.h>
-#include <QtQml/qqmlcomponent.h>
-#include <QtQml/qqmlcontext.h>
-#include <QtQml/qqmlengine.h>
-#include <QtQml/qqmllist.h>
-#include <type_traits>
-namespace QmlCacheGeneratedCode {
-namespace _0x5f_PixelPilot_src_ui_NodeGraph_qml {
-extern const unsigned char qmlData alignas(16) [];
-extern const unsigned char qmlData alignas(16) [] = {
-
-0x71,0x76,0x34,0x63,0x64,0x61,0x74,0x61,
-0x48,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x80,0x14,0x0,0x0,0xf6,0xd6,0x33,0xfb,
-0x88,0x66,0xa4,0x45,0xb1,0x77,0x2a,0x73,
-0xa0,0x30,0xb6,0xb0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x23,0x0,0x0,0x0,
-0x32,0x0,0x0,0x0,0xf0,0x5,0x0,0x0,
-0xd,0x0,0x0,0x0,0xc8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xfc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xfc,0x0,0x0,0x0,
-0x2,0x0,0x0,0x0,0xfc,0x0,0x0,0x0,
-0x12,0x0,0x0,0x0,0x4,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x4c,0x1,0x0,0x0,
-0x8,0x0,0x0,0x0,0x50,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x90,0x1,0x0,0x0,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x20,0xc,0x0,0x0,
-0x90,0x1,0x0,0x0,0xe0,0x1,0x0,0x0,
-0x30,0x2,0x0,0x0,0x88,0x2,0x0,0x0,
-0xe0,0x2,0x0,0x0,0x30,0x3,0x0,0x0,
-0x80,0x3,0x0,0x0,0xe0,0x3,0x0,0x0,
-0x40,0x4,0x0,0x0,0x90,0x4,0x0,0x0,
-0xe0,0x4,0x0,0x0,0x30,0x5,0x0,0x0,
-0x80,0x5,0x0,0x0,0xd0,0x5,0x0,0x0,
-0xe0,0x5,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x40,0x0,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x60,0x0,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x40,0x0,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x60,0x0,0x0,0x0,0xf3,0x2,0x0,0x0,
-0xf3,0x2,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x83,0x0,0x0,0x0,0x3,0x3,0x0,0x0,
-0x10,0x3,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x40,0x0,0x0,0x0,0xf3,0x2,0x0,0x0,
-0x60,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x40,0xac,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x80,0x87,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0x9c,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8a,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x80,0x97,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xdd,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0x5,0x40,
-0x0,0x0,0x0,0x0,0x0,0x40,0xf5,0x7f,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x7,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x0,0x3c,0x1,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x8,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x2,0x3c,0x3,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x8,0x0,0x0,0x0,
-0xd,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x4,0x3c,0x5,
-0x18,0x7,0x10,0x2,0x9c,0x7,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x8,0x0,0x0,0x0,
-0xe,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x6,0x3c,0x7,
-0x18,0x7,0x10,0x2,0x9c,0x7,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x12,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x12,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x8,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x1b,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x2d,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x9,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x50,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x2c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x40,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x40,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x42,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0xca,0xd4,0x16,0x6,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x50,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x2e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x44,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x44,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x46,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0xca,0xd4,0x16,0x6,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x37,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x37,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xa,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x22,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x38,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x38,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xb,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x24,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x39,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x39,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xc,0x3c,0xd,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x26,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x3a,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3a,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xe,0x3c,0xf,
-0x78,0x18,0x6,0x2,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x29,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x3c,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3c,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x10,0x3c,0x11,
-0x78,0x18,0x6,0x2,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb8,0x6,0x0,0x0,0xc0,0x6,0x0,0x0,
-0xd8,0x6,0x0,0x0,0xe8,0x6,0x0,0x0,
-0x0,0x7,0x0,0x0,0x10,0x7,0x0,0x0,
-0x40,0x7,0x0,0x0,0x58,0x7,0x0,0x0,
-0x88,0x7,0x0,0x0,0x98,0x7,0x0,0x0,
-0xc0,0x7,0x0,0x0,0xd8,0x7,0x0,0x0,
-0xe8,0x7,0x0,0x0,0x18,0x8,0x0,0x0,
-0x30,0x8,0x0,0x0,0x48,0x8,0x0,0x0,
-0x50,0x8,0x0,0x0,0x58,0x8,0x0,0x0,
-0x70,0x8,0x0,0x0,0x88,0x8,0x0,0x0,
-0x98,0x8,0x0,0x0,0xa8,0x8,0x0,0x0,
-0xd0,0x8,0x0,0x0,0xe0,0x8,0x0,0x0,
-0xf0,0x8,0x0,0x0,0x0,0x9,0x0,0x0,
-0x18,0x9,0x0,0x0,0x30,0x9,0x0,0x0,
-0x68,0x9,0x0,0x0,0x78,0x9,0x0,0x0,
-0x80,0x9,0x0,0x0,0x98,0x9,0x0,0x0,
-0xb8,0x9,0x0,0x0,0xc8,0x9,0x0,0x0,
-0xe0,0x9,0x0,0x0,0x10,0xa,0x0,0x0,
-0x20,0xa,0x0,0x0,0x50,0xa,0x0,0x0,
-0x68,0xa,0x0,0x0,0xa0,0xa,0x0,0x0,
-0xb8,0xa,0x0,0x0,0xd0,0xa,0x0,0x0,
-0x8,0xb,0x0,0x0,0x20,0xb,0x0,0x0,
-0x38,0xb,0x0,0x0,0x70,0xb,0x0,0x0,
-0x98,0xb,0x0,0x0,0xe0,0xb,0x0,0x0,
-0xf8,0xb,0x0,0x0,0x8,0xc,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x51,0x0,0x74,0x0,
-0x51,0x0,0x75,0x0,0x69,0x0,0x63,0x0,
-0x6b,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x49,0x0,0x74,0x0,
-0x65,0x0,0x6d,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x6e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x47,0x0,0x72,0x0,
-0x61,0x0,0x70,0x0,0x68,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x69,0x0,
-0x64,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x14,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x77,0x0,0x69,0x0,0x64,0x0,
-0x74,0x0,0x68,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x68,0x0,0x65,0x0,
-0x69,0x0,0x67,0x0,0x68,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x68,0x0,0x65,0x0,0x69,0x0,
-0x67,0x0,0x68,0x0,0x74,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x6f,0x0,
-0x72,0x0,0x6c,0x0,0x64,0x0,0x0,0x0,
-0xe,0x0,0x0,0x0,0x47,0x0,0x72,0x0,
-0x69,0x0,0x64,0x0,0x42,0x0,0x61,0x0,
-0x63,0x0,0x6b,0x0,0x67,0x0,0x72,0x0,
-0x6f,0x0,0x75,0x0,0x6e,0x0,0x64,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x61,0x0,0x6e,0x0,
-0x63,0x0,0x68,0x0,0x6f,0x0,0x72,0x0,
-0x73,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x69,0x0,
-0x6c,0x0,0x6c,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x66,0x0,0x69,0x0,0x6c,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x4e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x42,0x0,0x6c,0x0,
-0x6f,0x0,0x63,0x0,0x6b,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x74,0x0,0x65,0x0,
-0x73,0x0,0x74,0x0,0x4e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x31,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x78,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x79,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x74,0x0,0x65,0x0,
-0x73,0x0,0x74,0x0,0x4e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x32,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x74,0x0,0x65,0x0,
-0x73,0x0,0x74,0x0,0x4e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x33,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x54,0x0,0x65,0x0,
-0x78,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x74,0x0,0x65,0x0,
-0x78,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0xf,0x0,0x0,0x0,0x50,0x0,0x72,0x0,
-0x6f,0x0,0x63,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x3a,0x0,0x20,0x0,0x46,0x0,
-0x69,0x0,0x6c,0x0,0x74,0x0,0x65,0x0,
-0x72,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x63,0x0,0x6f,0x0,
-0x6c,0x0,0x6f,0x0,0x72,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x68,0x0,
-0x69,0x0,0x74,0x0,0x65,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x6f,0x0,
-0x6e,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x70,0x0,0x69,0x0,
-0x78,0x0,0x65,0x0,0x6c,0x0,0x53,0x0,
-0x69,0x0,0x7a,0x0,0x65,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x63,0x0,0x65,0x0,
-0x6e,0x0,0x74,0x0,0x65,0x0,0x72,0x0,
-0x49,0x0,0x6e,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x63,0x0,0x65,0x0,0x6e,0x0,
-0x74,0x0,0x65,0x0,0x72,0x0,0x49,0x0,
-0x6e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x62,0x0,0x6f,0x0,
-0x6c,0x0,0x64,0x0,0x0,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x7a,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x4d,0x0,0x6f,0x0,
-0x75,0x0,0x73,0x0,0x65,0x0,0x41,0x0,
-0x72,0x0,0x65,0x0,0x61,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x70,0x0,0x61,0x0,
-0x6e,0x0,0x4d,0x0,0x6f,0x0,0x75,0x0,
-0x73,0x0,0x65,0x0,0x41,0x0,0x72,0x0,
-0x65,0x0,0x61,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x64,0x0,0x72,0x0,
-0x61,0x0,0x67,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x74,0x0,0x61,0x0,
-0x72,0x0,0x67,0x0,0x65,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x74,0x0,0x61,0x0,0x72,0x0,
-0x67,0x0,0x65,0x0,0x74,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x61,0x0,0x78,0x0,
-0x69,0x0,0x73,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x61,0x0,0x78,0x0,0x69,0x0,
-0x73,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x6d,0x0,0x69,0x0,
-0x6e,0x0,0x69,0x0,0x6d,0x0,0x75,0x0,
-0x6d,0x0,0x58,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6d,0x0,0x69,0x0,0x6e,0x0,
-0x69,0x0,0x6d,0x0,0x75,0x0,0x6d,0x0,
-0x58,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x6d,0x0,0x61,0x0,
-0x78,0x0,0x69,0x0,0x6d,0x0,0x75,0x0,
-0x6d,0x0,0x58,0x0,0x0,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x6d,0x0,0x69,0x0,
-0x6e,0x0,0x69,0x0,0x6d,0x0,0x75,0x0,
-0x6d,0x0,0x59,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6d,0x0,0x69,0x0,0x6e,0x0,
-0x69,0x0,0x6d,0x0,0x75,0x0,0x6d,0x0,
-0x59,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x6d,0x0,0x61,0x0,
-0x78,0x0,0x69,0x0,0x6d,0x0,0x75,0x0,
-0x6d,0x0,0x59,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x50,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x65,0x0,0x64,0x0,0x0,0x0,
-0x18,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x50,0x0,
-0x72,0x0,0x65,0x0,0x73,0x0,0x73,0x0,
-0x65,0x0,0x64,0x0,0x0,0x0,0x0,0x0,
-0x11,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x50,0x0,0x6f,0x0,0x73,0x0,0x69,0x0,
-0x74,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x43,0x0,0x68,0x0,0x61,0x0,0x6e,0x0,
-0x67,0x0,0x65,0x0,0x64,0x0,0x0,0x0,
-0x20,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x50,0x0,
-0x6f,0x0,0x73,0x0,0x69,0x0,0x74,0x0,
-0x69,0x0,0x6f,0x0,0x6e,0x0,0x43,0x0,
-0x68,0x0,0x61,0x0,0x6e,0x0,0x67,0x0,
-0x65,0x0,0x64,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x70,0x0,0x61,0x0,
-0x72,0x0,0x65,0x0,0x6e,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x44,0x0,0x72,0x0,
-0x61,0x0,0x67,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x58,0x0,0x41,0x0,
-0x6e,0x0,0x64,0x0,0x59,0x0,0x41,0x0,
-0x78,0x0,0x69,0x0,0x73,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0x24,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x10,0x0,
-0xff,0xff,0x0,0x0,0x58,0x0,0x0,0x0,
-0x10,0x1,0x0,0x0,0xf8,0x1,0x0,0x0,
-0x68,0x2,0x0,0x0,0xd8,0x2,0x0,0x0,
-0x60,0x3,0x0,0x0,0xe8,0x3,0x0,0x0,
-0x88,0x4,0x0,0x0,0x58,0x5,0x0,0x0,
-0xe0,0x5,0x0,0x0,0x50,0x6,0x0,0x0,
-0x8,0x7,0x0,0x0,0x78,0x7,0x0,0x0,
-0x2,0x0,0x0,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x4,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0x3,0x0,0x10,0x0,
-0x4,0x0,0x50,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x8,0x0,0x50,0x0,
-0x8,0x0,0xd0,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x7,0x0,0x50,0x0,
-0x7,0x0,0xc0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb,0x0,0x50,0x0,
-0xb,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0xa,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x35,0x0,0x50,0x0,
-0x35,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x2,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x6,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0xb,0x0,0x50,0x0,
-0xc,0x0,0x90,0x0,0xe4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe,0x0,0x90,0x0,
-0xe,0x0,0x10,0x1,0x4,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xd,0x0,0x90,0x0,
-0xd,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x11,0x0,0x90,0x0,
-0x11,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x16,0x0,0x90,0x0,
-0x16,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x5,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1d,0x0,0x90,0x0,
-0x1d,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x24,0x0,0x90,0x0,
-0x24,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x11,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x12,0x0,0xd0,0x0,
-0x12,0x0,0x50,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x12,0x0,0xd0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x12,0x0,0x50,0x1,
-0x12,0x0,0xb0,0x1,0x0,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0xe,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x16,0x0,0x90,0x0,
-0x17,0x0,0xd0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x19,0x0,0xd0,0x0,
-0x19,0x0,0x0,0x1,0xf,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x18,0x0,0xd0,0x0,
-0x18,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0x11,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x1d,0x0,0x90,0x0,
-0x1e,0x0,0xd0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x20,0x0,0xd0,0x0,
-0x20,0x0,0x0,0x1,0xf,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1f,0x0,0xd0,0x0,
-0x1f,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0x12,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x24,0x0,0x90,0x0,
-0x25,0x0,0xd0,0x0,0x9c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x27,0x0,0xd0,0x0,
-0x27,0x0,0x0,0x1,0xf,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x26,0x0,0xd0,0x0,
-0x26,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x7,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x29,0x0,0xd0,0x0,
-0x29,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x5,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xcc,0x0,0x0,0x0,0x29,0x0,0xd0,0x0,
-0x0,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xcc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1d,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2f,0x0,0x10,0x1,
-0x2f,0x0,0x40,0x1,0x16,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x2b,0x0,0x10,0x1,
-0x2b,0x0,0x80,0x1,0x14,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x2a,0x0,0x10,0x1,
-0x2a,0x0,0x70,0x1,0xa,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0x9,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x10,0x1,
-0x2d,0x0,0x90,0x1,0x18,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0x8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2c,0x0,0x10,0x1,
-0x2c,0x0,0x60,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x2c,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1c,0x0,0x0,0x0,
-0x0,0x0,0x1,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2e,0x0,0x60,0x1,
-0x2e,0x0,0xc0,0x1,0x19,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x5,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2c,0x0,0x60,0x1,
-0x2c,0x0,0x10,0x2,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x2d,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1a,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x5,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x90,0x1,
-0x2d,0x0,0x30,0x2,0x0,0x0,0x0,0x0,
-0x1e,0x0,0x0,0x0,0x1f,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x4,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0x35,0x0,0x50,0x0,
-0x36,0x0,0x90,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x7,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x44,0x0,0x90,0x0,
-0x44,0x0,0xc0,0x1,0x2b,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x40,0x0,0x90,0x0,
-0x40,0x0,0x40,0x1,0x20,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0xc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x38,0x0,0x90,0x0,
-0x38,0x0,0xe0,0x0,0xa,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x37,0x0,0x90,0x0,
-0x37,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x37,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x37,0x0,0x10,0x1,
-0x37,0x0,0x70,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x6,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x38,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2a,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x7,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3d,0x0,0xe0,0x0,
-0x3d,0x0,0x80,0x1,0x28,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0xc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3c,0x0,0xe0,0x0,
-0x3c,0x0,0x80,0x1,0x27,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x7,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3b,0x0,0xe0,0x0,
-0x3b,0x0,0x80,0x1,0x25,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3a,0x0,0xe0,0x0,
-0x3a,0x0,0x80,0x1,0x23,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0xa,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x39,0x0,0xe0,0x0,
-0x39,0x0,0x40,0x1,0x21,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x9,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x38,0x0,0xe0,0x0,
-0x38,0x0,0x60,0x1,0x0,0x0,0x0,0x0
-};
-QT_WARNING_PUSH
-QT_WARNING_DISABLE_MSVC(4573)
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[] = {
-{ 0, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for width at line 7, column 5
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(0, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(1, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(1, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_2;
-}
-return;
-}
- },{ 1, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for height at line 8, column 5
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(2, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(2);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(3, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(3, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_2;
-}
-return;
-}
- },{ 2, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for width at line 13, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-double v2_6;
-double v2_8;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(4, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(4);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(5, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(5, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_StoreReg
-{
-}
-// generate_LoadInt
-s.v2_6 = double(2);
-{
-}
-// generate_Mul
-s.v2_8 = (s.v2_2 * s.v2_6);
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_8;
-}
-return;
-}
- },{ 3, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for height at line 14, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-double v2_6;
-double v2_8;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(6, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(6);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(7, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(7, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_StoreReg
-{
-}
-// generate_LoadInt
-s.v2_6 = double(2);
-{
-}
-// generate_Mul
-s.v2_8 = (s.v2_2 * s.v2_6);
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_8;
-}
-return;
-}
- },{ 5, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for centerIn at line 45, column 17
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(9, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(9);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 6, 1, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType();
-    argTypes[1] = []() { static const auto t = QMetaType::fromName("QQuickMouseEvent*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for onPressed at line 64, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_CreateCallContext
-{
-{
-}
-// generate_PopContext
-{}
-}
-{
-}
-{
-}
-// generate_Ret
-return;
-}
- },{ 7, 1, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType();
-    argTypes[1] = []() { static const auto t = QMetaType::fromName("QQuickMouseEvent*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for onPositionChanged at line 68, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_CreateCallContext
-{
-{
-}
-// generate_PopContext
-{}
-}
-{
-}
-{
-}
-// generate_Ret
-return;
-}
- },{ 8, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for fill at line 55, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(10, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(10);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 9, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for target at line 56, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadContextIdLookup(11, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadContextIdLookup(11);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 10, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickDrag::Axis"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for axis at line 57, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-int v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getEnumLookup(13, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetEnumLookup(13, []() { static const auto t = QMetaType::fromName("QQuickDrag*"); return t; }().metaObject(), "Axis", "XAndYAxis");
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickDrag::Axis"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    const QMetaType returnType = QMetaType::fromType<int>();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], &s.v2_2);
-}
-return;
-}
- },{ 11, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for minimumX at line 58, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-double v2_4;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(14, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(14);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(15, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(15, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_UMinus
-s.v2_4 = -s.v2_2;
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_4;
-}
-return;
-}
- },{ 12, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for minimumY at line 60, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-double v2_4;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(16, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(16);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(17, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(17, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_UMinus
-s.v2_4 = -s.v2_2;
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_4;
-}
-return;
-}
- },{ 0, 0, nullptr, nullptr }};
-QT_WARNING_POP
-}
-}
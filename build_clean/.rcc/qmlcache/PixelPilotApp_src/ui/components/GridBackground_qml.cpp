@@ -1,795 +0,0 @@
-// /PixelPilot/src/ui/components/GridBackground.qml
-#include <QtQml/qqmlprivate.h>
-#include <QtCore/qdatetime.h>
-#include <QtCore/qobject.h>
-#include <QtCore/qstring.h>
-#include <QtCore/qstringlist.h>
-#include <QtCore/qtimezone.h>
-#include <QtCore/qurl.h>
-#include <QtCore/qvariant.h>
-#include <QtQml/qjsengine.h>
-#include <QtQml/qjsprimitivevalue.h>
-#include <QtQml/qjsvalue.h>
-#include <QtQml/qqmlcomponent.h>
-#include <QtQml/qqmlcontext.h>
-#include <QtQml/qqmlengine.h>
-#include <QtQml/qqmllist.h>
-#include <type_traits>
-namespace QmlCacheGeneratedCode {
-namespace _0x5f_PixelPilot_src_ui_components_GridBackground_qml {
-extern const unsigned char qmlData alignas(16) [];
-extern const unsigned char qmlData alignas(16) [] = {
-
-0x71,0x76,0x34,0x63,0x64,0x61,0x74,0x61,
-0x48,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe0,0xc,0x0,0x0,0xc8,0xe0,0x22,0xc7,
-0xcb,0xd9,0x59,0x1d,0x65,0xf,0x8c,0xbb,
-0xb7,0x38,0x11,0xbe,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x23,0x0,0x0,0x0,
-0x20,0x0,0x0,0x0,0x98,0x5,0x0,0x0,
-0x7,0x0,0x0,0x0,0xc8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x3,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x19,0x0,0x0,0x0,0xf0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x1,0x0,0x0,
-0x2,0x0,0x0,0x0,0x60,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0x70,0x1,0x0,0x0,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xd0,0x9,0x0,0x0,
-0x70,0x1,0x0,0x0,0xc0,0x1,0x0,0x0,
-0x10,0x2,0x0,0x0,0x60,0x2,0x0,0x0,
-0x58,0x4,0x0,0x0,0xb8,0x4,0x0,0x0,
-0x18,0x5,0x0,0x0,0x68,0x5,0x0,0x0,
-0x78,0x5,0x0,0x0,0x88,0x5,0x0,0x0,
-0x43,0x1,0x0,0x0,0x30,0x0,0x0,0x0,
-0x43,0x1,0x0,0x0,0x50,0x0,0x0,0x0,
-0x43,0x1,0x0,0x0,0x53,0x1,0x0,0x0,
-0x60,0x1,0x0,0x0,0x74,0x1,0x0,0x0,
-0x91,0x1,0x0,0x0,0xa1,0x1,0x0,0x0,
-0x33,0x0,0x0,0x0,0xb4,0x1,0x0,0x0,
-0xc4,0x1,0x0,0x0,0x53,0x0,0x0,0x0,
-0xd4,0x1,0x0,0x0,0xe4,0x1,0x0,0x0,
-0x53,0x0,0x0,0x0,0xb4,0x1,0x0,0x0,
-0xc4,0x1,0x0,0x0,0x33,0x0,0x0,0x0,
-0xd4,0x1,0x0,0x0,0xe4,0x1,0x0,0x0,
-0xf7,0x1,0x0,0x0,0xf7,0x1,0x0,0x0,
-0x43,0x1,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0xc0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x4,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x4,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x0,0x3c,0x1,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x5,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x2,0x3c,0x3,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x9,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x4,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x1,0x0,0x0,0x9d,0x0,0x0,0x0,
-0xf,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x17,0x0,
-0xff,0xff,0xff,0xff,0x11,0x0,0x0,0x0,
-0x10,0x0,0x90,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0xc,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x11,0x0,0x0,0x0,0x2,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x12,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0xc,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x10,0x0,0x0,0x0,0x16,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x14,0x0,0x0,0x0,
-0x19,0x0,0x0,0x0,0x8,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x1a,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x1c,0x0,0x0,0x0,
-0x1c,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x28,0x0,0x0,0x0,0x1d,0x0,0x0,0x0,
-0xe,0x0,0x0,0x0,0x2d,0x0,0x0,0x0,
-0x1e,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x1f,0x0,0x0,0x0,
-0x12,0x0,0x0,0x0,0x44,0x0,0x0,0x0,
-0x20,0x0,0x0,0x0,0x14,0x0,0x0,0x0,
-0x49,0x0,0x0,0x0,0x21,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x4c,0x0,0x0,0x0,
-0x1c,0x0,0x0,0x0,0x15,0x0,0x0,0x0,
-0x55,0x0,0x0,0x0,0x24,0x0,0x0,0x0,
-0x16,0x0,0x0,0x0,0x61,0x0,0x0,0x0,
-0x24,0x0,0x0,0x0,0x17,0x0,0x0,0x0,
-0x64,0x0,0x0,0x0,0x25,0x0,0x0,0x0,
-0x18,0x0,0x0,0x0,0x6b,0x0,0x0,0x0,
-0x26,0x0,0x0,0x0,0x19,0x0,0x0,0x0,
-0x78,0x0,0x0,0x0,0x27,0x0,0x0,0x0,
-0x1a,0x0,0x0,0x0,0x86,0x0,0x0,0x0,
-0x28,0x0,0x0,0x0,0x1b,0x0,0x0,0x0,
-0x8d,0x0,0x0,0x0,0x29,0x0,0x0,0x0,
-0x1c,0x0,0x0,0x0,0x90,0x0,0x0,0x0,
-0x24,0x0,0x0,0x0,0x1c,0x0,0x0,0x0,
-0x99,0x0,0x0,0x0,0x2a,0x0,0x0,0x0,
-0x1c,0x0,0x0,0x0,0x1f,0x0,0x0,0x0,
-0x58,0x0,0x0,0x0,0xca,0x2e,0x5,0x3c,
-0x6,0x18,0x7,0xac,0x7,0x7,0x0,0x0,
-0x10,0x14,0x18,0x8,0x12,0x18,0x18,0x9,
-0x42,0x8,0x7,0x10,0x1,0x42,0x9,0x7,
-0x6,0x18,0xa,0x1a,0xa,0xc,0x2e,0xa,
-0x68,0xc,0x50,0x2d,0xac,0xb,0x7,0x0,
-0x0,0x1a,0xa,0xf,0x14,0x0,0x10,0xac,
-0xc,0x7,0x2,0xf,0x1a,0xa,0xf,0x2e,
-0xd,0x18,0x10,0xac,0xe,0x7,0x2,0xf,
-0xac,0xf,0x7,0x0,0x0,0x1a,0xa,0xd,
-0x16,0x8,0x80,0xd,0x18,0xa,0x56,0x4c,
-0xca,0x6,0x18,0xb,0x1a,0xb,0xc,0x2e,
-0x10,0x68,0xc,0x50,0x38,0x14,0x1,0x6,
-0xac,0x11,0x7,0x0,0x0,0x18,0x6,0x14,
-0x0,0xf,0x1a,0xb,0x10,0xac,0x12,0x7,
-0x2,0xf,0x18,0x6,0x2e,0x13,0x18,0xf,
-0x1a,0xb,0x10,0xac,0x14,0x7,0x2,0xf,
-0x18,0x6,0xac,0x15,0x7,0x0,0x0,0x18,
-0x6,0x1a,0xb,0xd,0x16,0x8,0x80,0xd,
-0x18,0xb,0x56,0x4c,0xbf,0xd4,0x16,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x50,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x11,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0xff,0xff,0xff,0xff,0x9,0x0,0x0,0x0,
-0x2c,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x2c,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0xca,0xb4,0x16,0x0,0x0,0x18,0x6,0xd4,
-0x16,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x50,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0xff,0xff,0xff,0xff,0x9,0x0,0x0,0x0,
-0x2d,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x2d,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0xca,0xb4,0x17,0x0,0x0,0x18,0x6,0xd4,
-0x16,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0xf,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xf,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x18,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x18,0x6,0x0,0x0,0x20,0x6,0x0,0x0,
-0x38,0x6,0x0,0x0,0x48,0x6,0x0,0x0,
-0x58,0x6,0x0,0x0,0x88,0x6,0x0,0x0,
-0xa0,0x6,0x0,0x0,0xd0,0x6,0x0,0x0,
-0xe8,0x6,0x0,0x0,0x0,0x7,0x0,0x0,
-0x10,0x7,0x0,0x0,0x40,0x7,0x0,0x0,
-0x50,0x7,0x0,0x0,0x68,0x7,0x0,0x0,
-0x80,0x7,0x0,0x0,0x98,0x7,0x0,0x0,
-0xd0,0x7,0x0,0x0,0xf8,0x7,0x0,0x0,
-0x38,0x8,0x0,0x0,0x60,0x8,0x0,0x0,
-0xa8,0x8,0x0,0x0,0xc0,0x8,0x0,0x0,
-0xd8,0x8,0x0,0x0,0xf0,0x8,0x0,0x0,
-0x0,0x9,0x0,0x0,0x18,0x9,0x0,0x0,
-0x38,0x9,0x0,0x0,0x50,0x9,0x0,0x0,
-0x68,0x9,0x0,0x0,0x80,0x9,0x0,0x0,
-0x98,0x9,0x0,0x0,0xb0,0x9,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x51,0x0,0x74,0x0,
-0x51,0x0,0x75,0x0,0x69,0x0,0x63,0x0,
-0x6b,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x49,0x0,0x74,0x0,
-0x65,0x0,0x6d,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x69,0x0,
-0x64,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x14,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x77,0x0,0x69,0x0,0x64,0x0,
-0x74,0x0,0x68,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x68,0x0,0x65,0x0,
-0x69,0x0,0x67,0x0,0x68,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x68,0x0,0x65,0x0,0x69,0x0,
-0x67,0x0,0x68,0x0,0x74,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x52,0x0,0x65,0x0,
-0x63,0x0,0x74,0x0,0x61,0x0,0x6e,0x0,
-0x67,0x0,0x6c,0x0,0x65,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x61,0x0,0x6e,0x0,
-0x63,0x0,0x68,0x0,0x6f,0x0,0x72,0x0,
-0x73,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x69,0x0,
-0x6c,0x0,0x6c,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x66,0x0,0x69,0x0,0x6c,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x63,0x0,0x6f,0x0,
-0x6c,0x0,0x6f,0x0,0x72,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x31,0x0,
-0x65,0x0,0x31,0x0,0x65,0x0,0x31,0x0,
-0x65,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x43,0x0,0x61,0x0,
-0x6e,0x0,0x76,0x0,0x61,0x0,0x73,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x50,0x0,0x61,0x0,0x69,0x0,0x6e,0x0,
-0x74,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x16,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x50,0x0,
-0x61,0x0,0x69,0x0,0x6e,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x57,0x0,0x69,0x0,0x64,0x0,0x74,0x0,
-0x68,0x0,0x43,0x0,0x68,0x0,0x61,0x0,
-0x6e,0x0,0x67,0x0,0x65,0x0,0x64,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1d,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x57,0x0,
-0x69,0x0,0x64,0x0,0x74,0x0,0x68,0x0,
-0x43,0x0,0x68,0x0,0x61,0x0,0x6e,0x0,
-0x67,0x0,0x65,0x0,0x64,0x0,0x0,0x0,
-0xf,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x48,0x0,0x65,0x0,0x69,0x0,0x67,0x0,
-0x68,0x0,0x74,0x0,0x43,0x0,0x68,0x0,
-0x61,0x0,0x6e,0x0,0x67,0x0,0x65,0x0,
-0x64,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1e,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x48,0x0,
-0x65,0x0,0x69,0x0,0x67,0x0,0x68,0x0,
-0x74,0x0,0x43,0x0,0x68,0x0,0x61,0x0,
-0x6e,0x0,0x67,0x0,0x65,0x0,0x64,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x70,0x0,0x61,0x0,
-0x72,0x0,0x65,0x0,0x6e,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x63,0x0,0x61,0x0,
-0x6e,0x0,0x76,0x0,0x61,0x0,0x73,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x63,0x0,0x6f,0x0,
-0x6e,0x0,0x74,0x0,0x65,0x0,0x78,0x0,
-0x74,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x72,0x0,0x65,0x0,
-0x73,0x0,0x65,0x0,0x74,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x33,0x0,
-0x65,0x0,0x33,0x0,0x65,0x0,0x33,0x0,
-0x65,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb,0x0,0x0,0x0,0x73,0x0,0x74,0x0,
-0x72,0x0,0x6f,0x0,0x6b,0x0,0x65,0x0,
-0x53,0x0,0x74,0x0,0x79,0x0,0x6c,0x0,
-0x65,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x6c,0x0,0x69,0x0,
-0x6e,0x0,0x65,0x0,0x57,0x0,0x69,0x0,
-0x64,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x62,0x0,0x65,0x0,
-0x67,0x0,0x69,0x0,0x6e,0x0,0x50,0x0,
-0x61,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x6d,0x0,0x6f,0x0,
-0x76,0x0,0x65,0x0,0x54,0x0,0x6f,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x6c,0x0,0x69,0x0,
-0x6e,0x0,0x65,0x0,0x54,0x0,0x6f,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x73,0x0,0x74,0x0,
-0x72,0x0,0x6f,0x0,0x6b,0x0,0x65,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x72,0x0,0x65,0x0,
-0x71,0x0,0x75,0x0,0x65,0x0,0x73,0x0,
-0x74,0x0,0x50,0x0,0x61,0x0,0x69,0x0,
-0x6e,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x24,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x10,0x0,
-0xff,0xff,0x0,0x0,0x38,0x0,0x0,0x0,
-0xf0,0x0,0x0,0x0,0x78,0x1,0x0,0x0,
-0xe8,0x1,0x0,0x0,0xa0,0x2,0x0,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x4,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0x3,0x0,0x10,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x5,0x0,0x50,0x0,
-0x5,0x0,0xd0,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x4,0x0,0x50,0x0,
-0x4,0x0,0xc0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x8,0x0,0x50,0x0,
-0x8,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x8,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe,0x0,0x50,0x0,
-0xe,0x0,0x50,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x8,0x0,0x50,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0xa,0x0,0x90,0x0,
-0xa,0x0,0x0,0x1,0x8,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9,0x0,0x90,0x0,
-0x9,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x9,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x2,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9,0x0,0x10,0x1,
-0x9,0x0,0x70,0x1,0x0,0x0,0x0,0x0,
-0xd,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x4,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0xe,0x0,0x50,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x12,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x5,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2d,0x0,0x90,0x0,
-0x2d,0x0,0xa0,0x1,0x10,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2c,0x0,0x90,0x0,
-0x2c,0x0,0x90,0x1,0xe,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x3,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x90,0x0,
-0x10,0x0,0x20,0x1,0x8,0x0,0x0,0x0,
-0x0,0x0,0xa,0x0,0x4,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xf,0x0,0x90,0x0,
-0xf,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0xff,0xff,0xff,0xff,0xff,0xff,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0xf,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x6,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xf,0x0,0x10,0x1,
-0xf,0x0,0x70,0x1,0x0,0x0,0x0,0x0
-};
-QT_WARNING_PUSH
-QT_WARNING_DISABLE_MSVC(4573)
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[] = {
-{ 0, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for width at line 4, column 5
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(0, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(1, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(1, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_2;
-}
-return;
-}
- },{ 1, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for height at line 5, column 5
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(2, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(2);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(3, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(3, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_2;
-}
-return;
-}
- },{ 2, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for fill at line 9, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(4, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(4);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 4, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for onWidthChanged at line 44, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_CreateCallContext
-{
-{
-}
-// generate_CallQmlContextPropertyLookup
-{
-const auto doCall = [&]() {
-    void *args[] = {nullptr};
-    return aotContext->callQmlContextPropertyLookup(22, args, 0);
-};
-const auto doInit = [&]() {
-    aotContext->initCallQmlContextPropertyLookup(22, 24);
-};
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(5);
-#endif
-while (!doCall()) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(5);
-#endif
-doInit();
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-}
-{
-}
-{
-}
-// generate_PopContext
-{}
-}
-{
-}
-{
-}
-// generate_Ret
-return;
-}
- },{ 5, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for onHeightChanged at line 45, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_CreateCallContext
-{
-{
-}
-// generate_CallQmlContextPropertyLookup
-{
-const auto doCall = [&]() {
-    void *args[] = {nullptr};
-    return aotContext->callQmlContextPropertyLookup(23, args, 0);
-};
-const auto doInit = [&]() {
-    aotContext->initCallQmlContextPropertyLookup(23, 24);
-};
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(5);
-#endif
-while (!doCall()) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(5);
-#endif
-doInit();
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-}
-{
-}
-{
-}
-// generate_PopContext
-{}
-}
-{
-}
-{
-}
-// generate_Ret
-return;
-}
- },{ 6, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for fill at line 15, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(24, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(24);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 0, 0, nullptr, nullptr }};
-QT_WARNING_POP
-}
-}
@@ -1,1542 +0,0 @@
-// /PixelPilot/src/ui/components/NodeBlock.qml
-#include <QtQml/qqmlprivate.h>
-#include <QtCore/qdatetime.h>
-#include <QtCore/qobject.h>
-#include <QtCore/qstring.h>
-#include <QtCore/qstringlist.h>
-#include <QtCore/qtimezone.h>
-#include <QtCore/qurl.h>
-#include <QtCore/qvariant.h>
-#include <QtQml/qjsengine.h>
-#include <QtQml/qjsprimitivevalue.h>
-#include <QtQml/qjsvalue.h>
-#include <QtQml/qqmlcomponent.h>
-#include <QtQml/qqmlcontext.h>
-#include <QtQml/qqmlengine.h>
-#include <QtQml/qqmllist.h>
-#include <type_traits>
-namespace QmlCacheGeneratedCode {
-namespace _0x5f_PixelPilot_src_ui_components_NodeBlock_qml {
-extern const unsigned char qmlData alignas(16) [];
-extern const unsigned char qmlData alignas(16) [] = {
-
-0x71,0x76,0x34,0x63,0x64,0x61,0x74,0x61,
-0x48,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4c,0x17,0x0,0x0,0x93,0xf4,0x19,0x99,
-0x19,0x7e,0xb9,0x61,0xd2,0xbe,0x23,0x83,
-0xf2,0x5d,0xf2,0x8f,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x23,0x0,0x0,0x0,
-0x34,0x0,0x0,0x0,0xd0,0x5,0x0,0x0,
-0xc,0x0,0x0,0x0,0xc8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xf8,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xf8,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0xf8,0x0,0x0,0x0,
-0x18,0x0,0x0,0x0,0xfc,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x5c,0x1,0x0,0x0,
-0x8,0x0,0x0,0x0,0x60,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0x0,0x0,0x0,0x0,0xa0,0x1,0x0,0x0,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x58,0xc,0x0,0x0,
-0xa0,0x1,0x0,0x0,0xf0,0x1,0x0,0x0,
-0x40,0x2,0x0,0x0,0x90,0x2,0x0,0x0,
-0xe0,0x2,0x0,0x0,0x30,0x3,0x0,0x0,
-0x80,0x3,0x0,0x0,0xd0,0x3,0x0,0x0,
-0x28,0x4,0x0,0x0,0x78,0x4,0x0,0x0,
-0xd0,0x4,0x0,0x0,0x20,0x5,0x0,0x0,
-0xc0,0x5,0x0,0x0,0x13,0x3,0x0,0x0,
-0x13,0x3,0x0,0x0,0x40,0x0,0x0,0x0,
-0x13,0x3,0x0,0x0,0x30,0x1,0x0,0x0,
-0x13,0x3,0x0,0x0,0x50,0x1,0x0,0x0,
-0x13,0x3,0x0,0x0,0x70,0x1,0x0,0x0,
-0x13,0x3,0x0,0x0,0x13,0x3,0x0,0x0,
-0x50,0x1,0x0,0x0,0x13,0x3,0x0,0x0,
-0x50,0x0,0x0,0x0,0x13,0x3,0x0,0x0,
-0x70,0x1,0x0,0x0,0x13,0x3,0x0,0x0,
-0x50,0x0,0x0,0x0,0x33,0x0,0x0,0x0,
-0x23,0x3,0x0,0x0,0x33,0x0,0x0,0x0,
-0x31,0x3,0x0,0x0,0x33,0x0,0x0,0x0,
-0x31,0x3,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x40,0x91,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xa1,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xd5,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0x5,0x40,
-0x0,0x0,0x0,0x0,0x0,0x40,0xcc,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xdd,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xed,0x3f,
-0x0,0x0,0x0,0x0,0x0,0x40,0xed,0xbf,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0xc,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xc,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x0,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x11,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x15,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x15,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x1,0x3c,0x2,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x14,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x19,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x19,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x3,0x3c,0x4,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x16,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x1a,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1a,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x5,0x3c,0x6,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x18,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x1b,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1b,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x7,0x3c,0x8,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x21,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x22,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x22,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x9,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x16,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x2e,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x2e,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xa,0x3c,0xb,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x27,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x8,0x0,0x0,0x0,
-0x30,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x30,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xc,0x3c,0xd,
-0x18,0x7,0x10,0x2,0x9e,0x7,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x7,0x0,0x0,0x0,
-0x18,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x3e,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x3e,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0xe,0x3c,0xf,
-0x18,0x6,0x2,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0x27,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x8,0x0,0x0,0x0,
-0x40,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x40,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x10,0x3c,0x11,
-0x18,0x7,0x10,0x2,0x9e,0x7,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x0,0x0,0x5,0x0,0x0,0x0,
-0x2e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0xff,0xff,0xff,0xff,0x7,0x0,0x0,0x0,
-0x4b,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x4b,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x2e,0x12,0x18,0x6,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x74,0x0,0x0,0x0,0x26,0x0,0x0,0x0,
-0x30,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x0,0x0,0x0,0x0,0x5,0x0,
-0xff,0xff,0xff,0xff,0x9,0x0,0x0,0x0,
-0x4c,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x4c,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x4d,0x0,0x0,0x0,0x2,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x4e,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x15,0x0,0x0,0x0,
-0x50,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x22,0x0,0x0,0x0,0x52,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0xca,0x2e,0x13,0x50,
-0x10,0x2e,0x14,0x18,0x7,0x10,0xa,0x18,
-0x8,0x42,0x15,0x7,0x1a,0x8,0x6,0x4c,
-0xd,0x2e,0x16,0x18,0x7,0x6,0x18,0x8,
-0x42,0x17,0x7,0x1a,0x8,0x6,0xd4,0x16,
-0x6,0x2,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xa0,0x6,0x0,0x0,0xa8,0x6,0x0,0x0,
-0xc0,0x6,0x0,0x0,0xd0,0x6,0x0,0x0,
-0xe8,0x6,0x0,0x0,0xf8,0x6,0x0,0x0,
-0x10,0x7,0x0,0x0,0x28,0x7,0x0,0x0,
-0x40,0x7,0x0,0x0,0x58,0x7,0x0,0x0,
-0x68,0x7,0x0,0x0,0x98,0x7,0x0,0x0,
-0xb0,0x7,0x0,0x0,0xc0,0x7,0x0,0x0,
-0xd8,0x7,0x0,0x0,0xf0,0x7,0x0,0x0,
-0x8,0x8,0x0,0x0,0x20,0x8,0x0,0x0,
-0x50,0x8,0x0,0x0,0x68,0x8,0x0,0x0,
-0x78,0x8,0x0,0x0,0xa8,0x8,0x0,0x0,
-0xb8,0x8,0x0,0x0,0xe8,0x8,0x0,0x0,
-0xf8,0x8,0x0,0x0,0x28,0x9,0x0,0x0,
-0x38,0x9,0x0,0x0,0x50,0x9,0x0,0x0,
-0x60,0x9,0x0,0x0,0x80,0x9,0x0,0x0,
-0x90,0x9,0x0,0x0,0xa0,0x9,0x0,0x0,
-0xb8,0x9,0x0,0x0,0xd0,0x9,0x0,0x0,
-0x8,0xa,0x0,0x0,0x18,0xa,0x0,0x0,
-0x30,0xa,0x0,0x0,0x48,0xa,0x0,0x0,
-0x68,0xa,0x0,0x0,0x90,0xa,0x0,0x0,
-0xd0,0xa,0x0,0x0,0xf0,0xa,0x0,0x0,
-0x8,0xb,0x0,0x0,0x28,0xb,0x0,0x0,
-0x48,0xb,0x0,0x0,0x68,0xb,0x0,0x0,
-0x80,0xb,0x0,0x0,0xb0,0xb,0x0,0x0,
-0xd8,0xb,0x0,0x0,0x20,0xc,0x0,0x0,
-0x38,0xc,0x0,0x0,0x50,0xc,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x51,0x0,0x74,0x0,
-0x51,0x0,0x75,0x0,0x69,0x0,0x63,0x0,
-0x6b,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x49,0x0,0x74,0x0,
-0x65,0x0,0x6d,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x6e,0x0,0x6f,0x0,
-0x64,0x0,0x65,0x0,0x42,0x0,0x6c,0x0,
-0x6f,0x0,0x63,0x0,0x6b,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x69,0x0,
-0x64,0x0,0x74,0x0,0x68,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x68,0x0,0x65,0x0,
-0x69,0x0,0x67,0x0,0x68,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x52,0x0,0x65,0x0,
-0x63,0x0,0x74,0x0,0x61,0x0,0x6e,0x0,
-0x67,0x0,0x6c,0x0,0x65,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x62,0x0,0x6c,0x0,
-0x6f,0x0,0x63,0x0,0x6b,0x0,0x52,0x0,
-0x65,0x0,0x63,0x0,0x74,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x61,0x0,0x6e,0x0,
-0x63,0x0,0x68,0x0,0x6f,0x0,0x72,0x0,
-0x73,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x69,0x0,
-0x6c,0x0,0x6c,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x66,0x0,0x69,0x0,0x6c,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x72,0x0,0x61,0x0,
-0x64,0x0,0x69,0x0,0x75,0x0,0x73,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x63,0x0,0x6f,0x0,
-0x6c,0x0,0x6f,0x0,0x72,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x32,0x0,
-0x64,0x0,0x32,0x0,0x64,0x0,0x32,0x0,
-0x64,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x62,0x0,0x6f,0x0,
-0x72,0x0,0x64,0x0,0x65,0x0,0x72,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x35,0x0,
-0x35,0x0,0x35,0x0,0x35,0x0,0x35,0x0,
-0x35,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x68,0x0,0x65,0x0,
-0x61,0x0,0x64,0x0,0x65,0x0,0x72,0x0,
-0x42,0x0,0x61,0x0,0x72,0x0,0x0,0x0,
-0x14,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x77,0x0,0x69,0x0,0x64,0x0,
-0x74,0x0,0x68,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x33,0x0,
-0x34,0x0,0x37,0x0,0x38,0x0,0x65,0x0,
-0x36,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3,0x0,0x0,0x0,0x74,0x0,0x6f,0x0,
-0x70,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x12,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x74,0x0,0x6f,0x0,0x70,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x6c,0x0,0x65,0x0,
-0x66,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6c,0x0,0x65,0x0,0x66,0x0,
-0x74,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x72,0x0,0x69,0x0,
-0x67,0x0,0x68,0x0,0x74,0x0,0x0,0x0,
-0x14,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x72,0x0,0x69,0x0,0x67,0x0,
-0x68,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x54,0x0,0x65,0x0,
-0x78,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x74,0x0,0x69,0x0,
-0x74,0x0,0x6c,0x0,0x65,0x0,0x54,0x0,
-0x65,0x0,0x78,0x0,0x74,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x74,0x0,0x65,0x0,
-0x78,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x49,0x0,0x6e,0x0,
-0x70,0x0,0x75,0x0,0x74,0x0,0x3a,0x0,
-0x20,0x0,0x4f,0x0,0x43,0x0,0x52,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x77,0x0,0x68,0x0,
-0x69,0x0,0x74,0x0,0x65,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x66,0x0,0x6f,0x0,
-0x6e,0x0,0x74,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x70,0x0,0x69,0x0,
-0x78,0x0,0x65,0x0,0x6c,0x0,0x53,0x0,
-0x69,0x0,0x7a,0x0,0x65,0x0,0x0,0x0,
-0x8,0x0,0x0,0x0,0x63,0x0,0x65,0x0,
-0x6e,0x0,0x74,0x0,0x65,0x0,0x72,0x0,
-0x49,0x0,0x6e,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x63,0x0,0x65,0x0,0x6e,0x0,
-0x74,0x0,0x65,0x0,0x72,0x0,0x49,0x0,
-0x6e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x62,0x0,0x6f,0x0,
-0x6c,0x0,0x64,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x69,0x0,0x6e,0x0,
-0x70,0x0,0x75,0x0,0x74,0x0,0x50,0x0,
-0x6f,0x0,0x72,0x0,0x74,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x34,0x0,
-0x63,0x0,0x61,0x0,0x66,0x0,0x35,0x0,
-0x30,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x6c,0x0,0x65,0x0,
-0x66,0x0,0x74,0x0,0x4d,0x0,0x61,0x0,
-0x72,0x0,0x67,0x0,0x69,0x0,0x6e,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe,0x0,0x0,0x0,0x76,0x0,0x65,0x0,
-0x72,0x0,0x74,0x0,0x69,0x0,0x63,0x0,
-0x61,0x0,0x6c,0x0,0x43,0x0,0x65,0x0,
-0x6e,0x0,0x74,0x0,0x65,0x0,0x72,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1d,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x76,0x0,0x65,0x0,0x72,0x0,
-0x74,0x0,0x69,0x0,0x63,0x0,0x61,0x0,
-0x6c,0x0,0x43,0x0,0x65,0x0,0x6e,0x0,
-0x74,0x0,0x65,0x0,0x72,0x0,0x0,0x0,
-0xa,0x0,0x0,0x0,0x6f,0x0,0x75,0x0,
-0x74,0x0,0x70,0x0,0x75,0x0,0x74,0x0,
-0x50,0x0,0x6f,0x0,0x72,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x23,0x0,0x66,0x0,
-0x66,0x0,0x39,0x0,0x38,0x0,0x30,0x0,
-0x30,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb,0x0,0x0,0x0,0x72,0x0,0x69,0x0,
-0x67,0x0,0x68,0x0,0x74,0x0,0x4d,0x0,
-0x61,0x0,0x72,0x0,0x67,0x0,0x69,0x0,
-0x6e,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb,0x0,0x0,0x0,0x44,0x0,0x72,0x0,
-0x61,0x0,0x67,0x0,0x48,0x0,0x61,0x0,
-0x6e,0x0,0x64,0x0,0x6c,0x0,0x65,0x0,
-0x72,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb,0x0,0x0,0x0,0x64,0x0,0x72,0x0,
-0x61,0x0,0x67,0x0,0x48,0x0,0x61,0x0,
-0x6e,0x0,0x64,0x0,0x6c,0x0,0x65,0x0,
-0x72,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x74,0x0,0x61,0x0,
-0x72,0x0,0x67,0x0,0x65,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x74,0x0,0x61,0x0,0x72,0x0,
-0x67,0x0,0x65,0x0,0x74,0x0,0x0,0x0,
-0xf,0x0,0x0,0x0,0x6f,0x0,0x6e,0x0,
-0x41,0x0,0x63,0x0,0x74,0x0,0x69,0x0,
-0x76,0x0,0x65,0x0,0x43,0x0,0x68,0x0,
-0x61,0x0,0x6e,0x0,0x67,0x0,0x65,0x0,
-0x64,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1e,0x0,0x0,0x0,0x65,0x0,0x78,0x0,
-0x70,0x0,0x72,0x0,0x65,0x0,0x73,0x0,
-0x73,0x0,0x69,0x0,0x6f,0x0,0x6e,0x0,
-0x20,0x0,0x66,0x0,0x6f,0x0,0x72,0x0,
-0x20,0x0,0x6f,0x0,0x6e,0x0,0x41,0x0,
-0x63,0x0,0x74,0x0,0x69,0x0,0x76,0x0,
-0x65,0x0,0x43,0x0,0x68,0x0,0x61,0x0,
-0x6e,0x0,0x67,0x0,0x65,0x0,0x64,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x70,0x0,0x61,0x0,
-0x72,0x0,0x65,0x0,0x6e,0x0,0x74,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x0,0x0,0x61,0x0,0x63,0x0,
-0x74,0x0,0x69,0x0,0x76,0x0,0x65,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x7a,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x10,0x0,0x0,0x0,
-0x10,0x0,0x0,0x0,0x24,0x0,0x0,0x0,
-0x1,0x0,0x0,0x0,0x1,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x1,0x0,0x10,0x0,
-0xff,0xff,0x0,0x0,0x64,0x0,0x0,0x0,
-0x1c,0x1,0x0,0x0,0x1c,0x2,0x0,0x0,
-0x8c,0x2,0x0,0x0,0x14,0x3,0x0,0x0,
-0xfc,0x3,0x0,0x0,0x9c,0x4,0x0,0x0,
-0x54,0x5,0x0,0x0,0xdc,0x5,0x0,0x0,
-0x4c,0x6,0x0,0x0,0x34,0x7,0x0,0x0,
-0xd4,0x7,0x0,0x0,0x5c,0x8,0x0,0x0,
-0x44,0x9,0x0,0x0,0xe4,0x9,0x0,0x0,
-0x6c,0xa,0x0,0x0,0x2,0x0,0x0,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x4,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x3,0x0,0x10,0x0,0x4,0x0,0x50,0x0,
-0xb4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x7,0x0,0x50,0x0,0x7,0x0,0xd0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6,0x0,0x50,0x0,0x6,0x0,0xc0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xa,0x0,0x50,0x0,0xa,0x0,0x50,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0xf,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x49,0x0,0x50,0x0,0x49,0x0,0x50,0x0,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x7,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xfc,0x0,0x0,0x0,
-0xa,0x0,0x50,0x0,0xb,0x0,0x90,0x0,
-0xfc,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xfc,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0xd,0x0,0x0,0x0,
-0xe,0x0,0x90,0x0,0xe,0x0,0x0,0x1,
-0xb,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xd,0x0,0x90,0x0,0xd,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x13,0x0,0x90,0x0,0x13,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0x9,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x28,0x0,0x90,0x0,0x28,0x0,0x90,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x38,0x0,0x90,0x0,0x38,0x0,0x90,0x0,
-0xe,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xf,0x0,0x90,0x0,0xf,0x0,0x0,0x1,
-0x8,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x90,0x0,0xc,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x1,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0xc,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x10,0x1,0xc,0x0,0x70,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0xf,0x0,0x90,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x10,0x0,0x0,0x1,0x10,0x0,0x70,0x1,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0xf,0x0,0x0,0x0,
-0xf,0x0,0x0,0x1,0xf,0x0,0x70,0x1,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x10,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x6,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x13,0x0,0x90,0x0,0x14,0x0,0xd0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x18,0x0,0xd0,0x0,0x18,0x0,0x50,0x1,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x12,0x0,0x0,0x0,
-0x17,0x0,0xd0,0x0,0x17,0x0,0x40,0x1,
-0x5,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x16,0x0,0xd0,0x0,0x16,0x0,0x50,0x1,
-0x4,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x15,0x0,0xd0,0x0,0x15,0x0,0x40,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x8,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1d,0x0,0xd0,0x0,0x1d,0x0,0xd0,0x0,
-0x8,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x19,0x0,0xd0,0x0,0x19,0x0,0x50,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9c,0x0,0x0,0x0,
-0x19,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x17,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1b,0x0,0x50,0x1,0x1b,0x0,0xc0,0x1,
-0x15,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x1a,0x0,0x50,0x1,0x1a,0x0,0xb0,0x1,
-0x13,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x2,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x19,0x0,0x50,0x1,0x19,0x0,0xa0,0x1,
-0x0,0x0,0x0,0x0,0x19,0x0,0x0,0x0,
-0x1a,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x4,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xb4,0x0,0x0,0x0,
-0x1d,0x0,0xd0,0x0,0x1e,0x0,0x10,0x1,
-0xb4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xb4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x1d,0x0,0x0,0x0,
-0x20,0x0,0x10,0x1,0x20,0x0,0x80,0x1,
-0x1b,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x1c,0x0,0x0,0x0,
-0x1f,0x0,0x10,0x1,0x1f,0x0,0x70,0x1,
-0x8,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x8,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x22,0x0,0x10,0x1,0x22,0x0,0x90,0x1,
-0x1e,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x21,0x0,0x10,0x1,0x21,0x0,0x60,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x21,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x22,0x0,0x0,0x0,0x0,0x0,0x1,0x0,
-0x1,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x23,0x0,0x60,0x1,0x23,0x0,0xc0,0x1,
-0x1f,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x21,0x0,0x60,0x1,0x21,0x0,0x10,0x2,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x1,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x6c,0x0,0x0,0x0,
-0x22,0x0,0x10,0x1,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x6c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x20,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x22,0x0,0x90,0x1,0x22,0x0,0x30,0x2,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x23,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x6,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x28,0x0,0x90,0x0,0x29,0x0,0xd0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x24,0x0,0x0,0x0,
-0x2d,0x0,0xd0,0x0,0x2d,0x0,0x40,0x1,
-0xb,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2c,0x0,0xd0,0x0,0x2c,0x0,0x50,0x1,
-0x5,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2b,0x0,0xd0,0x0,0x2b,0x0,0x50,0x1,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2a,0x0,0xd0,0x0,0x2a,0x0,0x40,0x1,
-0xe,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0xb,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x33,0x0,0xd0,0x0,0x33,0x0,0x40,0x1,
-0x8,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0xa,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2e,0x0,0xd0,0x0,0x2e,0x0,0x50,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9c,0x0,0x0,0x0,
-0x2e,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x26,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x30,0x0,0x50,0x1,0x30,0x0,0x50,0x2,
-0x25,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2f,0x0,0x50,0x1,0x2f,0x0,0x10,0x2,
-0x15,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2e,0x0,0x50,0x1,0x2e,0x0,0xb0,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x33,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x34,0x0,0x40,0x1,0x34,0x0,0xb0,0x1,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x1d,0x0,0x0,0x0,
-0x33,0x0,0x40,0x1,0x33,0x0,0xb0,0x1,
-0x0,0x0,0x0,0x0,0x6,0x0,0x0,0x0,
-0x28,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x6,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0xe4,0x0,0x0,0x0,
-0x38,0x0,0x90,0x0,0x39,0x0,0xd0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xe4,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x29,0x0,0x0,0x0,
-0x3d,0x0,0xd0,0x0,0x3d,0x0,0x40,0x1,
-0xb,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x6,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3c,0x0,0xd0,0x0,0x3c,0x0,0x50,0x1,
-0x5,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3b,0x0,0xd0,0x0,0x3b,0x0,0x50,0x1,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x5,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3a,0x0,0xd0,0x0,0x3a,0x0,0x40,0x1,
-0xe,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0xe,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x43,0x0,0xd0,0x0,0x43,0x0,0x40,0x1,
-0x8,0x0,0x0,0x0,0x0,0x0,0xa,0x0,
-0xd,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3e,0x0,0xd0,0x0,0x3e,0x0,0x50,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x3,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x9c,0x0,0x0,0x0,
-0x3e,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x9c,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x26,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x9,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x40,0x0,0x50,0x1,0x40,0x0,0x50,0x2,
-0x2a,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x7,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3f,0x0,0x50,0x1,0x3f,0x0,0x20,0x2,
-0x17,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0x8,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x3e,0x0,0x50,0x1,0x3e,0x0,0xc0,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x43,0x0,0xd0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4,0x0,0x0,0x0,0x0,0x0,0x2,0x0,
-0x3,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x44,0x0,0x40,0x1,0x44,0x0,0xb0,0x1,
-0xc,0x0,0x0,0x0,0x0,0x0,0x3,0x0,
-0x0,0x0,0x0,0x0,0x1d,0x0,0x0,0x0,
-0x43,0x0,0x40,0x1,0x43,0x0,0xb0,0x1,
-0x0,0x0,0x0,0x0,0x2b,0x0,0x0,0x0,
-0x2c,0x0,0x0,0x0,0x0,0x0,0xff,0xff,
-0xff,0xff,0xff,0xff,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x54,0x0,0x0,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x2,0x0,0x54,0x0,0x0,0x0,
-0x0,0x0,0x0,0x0,0x84,0x0,0x0,0x0,
-0x49,0x0,0x50,0x0,0x4a,0x0,0x90,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x84,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x2f,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0xb,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4c,0x0,0x90,0x0,0x4c,0x0,0xa0,0x1,
-0x2d,0x0,0x0,0x0,0x0,0x0,0x7,0x0,
-0xa,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-0x4b,0x0,0x90,0x0,0x4b,0x0,0x10,0x1,
-0x0,0x0,0x0,0x0
-};
-QT_WARNING_PUSH
-QT_WARNING_DISABLE_MSVC(4573)
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[];
-extern const QQmlPrivate::AOTCompiledFunction aotBuiltFunctions[] = {
-{ 0, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for fill at line 12, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(0, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 1, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType::fromType<double>();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for width at line 21, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-double v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(1, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(1);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-while (!aotContext->getObjectLookup(2, s.v2_0, &s.v2_2)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(2, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = double();
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<double *>(argv[0]) = s.v2_2;
-}
-return;
-}
- },{ 2, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for top at line 25, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-    aotContext->mark(v2_2, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-QVariant v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(3, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(3);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(4));
-while (!aotContext->getObjectLookup(4, s.v2_0, s.v2_2.data())) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(4, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(4));
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    if (!s.v2_2.isValid())
-        aotContext->setReturnValueUndefined();
-    const QMetaType returnType = s.v2_2.metaType();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], s.v2_2.data());
-}
-return;
-}
- },{ 3, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for left at line 26, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-    aotContext->mark(v2_2, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-QVariant v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(5, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(5);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(6));
-while (!aotContext->getObjectLookup(6, s.v2_0, s.v2_2.data())) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(6, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(6));
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    if (!s.v2_2.isValid())
-        aotContext->setReturnValueUndefined();
-    const QMetaType returnType = s.v2_2.metaType();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], s.v2_2.data());
-}
-return;
-}
- },{ 4, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for right at line 27, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-    aotContext->mark(v2_2, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-QVariant v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(7, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(7);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(8));
-while (!aotContext->getObjectLookup(8, s.v2_0, s.v2_2.data())) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(8, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(8));
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    if (!s.v2_2.isValid())
-        aotContext->setReturnValueUndefined();
-    const QMetaType returnType = s.v2_2.metaType();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], s.v2_2.data());
-}
-return;
-}
- },{ 5, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for centerIn at line 34, column 17
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(9, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(9);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 6, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for left at line 46, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-    aotContext->mark(v2_2, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-QVariant v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(10, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(10);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(11));
-while (!aotContext->getObjectLookup(11, s.v2_0, s.v2_2.data())) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(11, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(11));
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    if (!s.v2_2.isValid())
-        aotContext->setReturnValueUndefined();
-    const QMetaType returnType = s.v2_2.metaType();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], s.v2_2.data());
-}
-return;
-}
- },{ 8, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for right at line 62, column 13
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-    aotContext->mark(v2_2, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-QVariant v2_2;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(14, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(14);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-}
-{
-}
-// generate_GetLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(15));
-while (!aotContext->getObjectLookup(15, s.v2_0, s.v2_2.data())) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(4);
-#endif
-aotContext->initGetObjectLookup(15, s.v2_0);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    const QMetaType returnType = []() { static const auto t = QMetaType::fromName("QQuickAnchorLine"); return t; }();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0]);
- }
-return;
-}
-s.v2_2 = QVariant(aotContext->lookupResultMetaType(15));
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    if (!s.v2_2.isValid())
-        aotContext->setReturnValueUndefined();
-    const QMetaType returnType = s.v2_2.metaType();
-    returnType.destruct(argv[0]);
-    returnType.construct(argv[0], s.v2_2.data());
-}
-return;
-}
- },{ 10, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = []() { static const auto t = QMetaType::fromName("QQuickItem*"); return t; }();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for target at line 75, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_0, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_0 = nullptr;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-while (!aotContext->loadContextIdLookup(18, &s.v2_0)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(2);
-#endif
-aotContext->initLoadContextIdLookup(18);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = nullptr;
-}
-return;
-}
-}
-{
-}
-{
-}
-// generate_Ret
-if (argv[0]) {
-    *static_cast<QObject * *>(argv[0]) = s.v2_0;
-}
-return;
-}
- },{ 11, 0, [](QV4::ExecutableCompilationUnit *contextUnit, QMetaType *argTypes) {
-    struct { QV4::ExecutableCompilationUnit *compilationUnit; } c { contextUnit };
-    const auto *aotContext = &c;
-    Q_UNUSED(aotContext);
-    argTypes[0] = QMetaType();
-}, 
-    [](const QQmlPrivate::AOTCompiledContext *aotContext, void **argv) {
-Q_UNUSED(aotContext)
-Q_UNUSED(argv)
-// expression for onActiveChanged at line 76, column 9
-struct Storage : QQmlPrivate::AOTTrackedLocalsStorage {
-Storage(const QQmlPrivate::AOTCompiledContext *ctxt, void **a)   : aotContext(ctxt), argv(a) {}
-void markObjects(QV4::MarkStack *markStack) const final {    Q_UNUSED(markStack);
-    aotContext->mark(v2_21, markStack);
-    aotContext->mark(v2_5, markStack);
-}
-const QQmlPrivate::AOTCompiledContext *aotContext;
-void **argv;
-QObject *v2_21 = nullptr;
-QObject *v2_5 = nullptr;
-bool v2_1;
-double v2_25;
-double v2_9;
-};
-Storage s(aotContext, argv);
-aotContext->setLocals(&s);
-// generate_CreateCallContext
-{
-{
-}
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(3);
-#endif
-while (!aotContext->loadScopeObjectPropertyLookup(19, &s.v2_1)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(3);
-#endif
-aotContext->initLoadScopeObjectPropertyLookup(19);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-{
-}
-// generate_JumpFalse
-if (!s.v2_1) {
-    goto label_0;
-}
-{
-}
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(7);
-#endif
-while (!aotContext->loadContextIdLookup(20, &s.v2_5)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(7);
-#endif
-aotContext->initLoadContextIdLookup(20);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-{
-}
-// generate_StoreReg
-{
-}
-// generate_LoadInt
-s.v2_9 = double(10);
-{
-}
-{
-}
-// generate_SetLookup
-{
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(16);
-#endif
-while (!aotContext->setObjectLookup(21, s.v2_5, &s.v2_9)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(16);
-#endif
-aotContext->initSetObjectLookup(21, s.v2_5);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-}
-{
-}
-{
-}
-// generate_Jump
-{
-    goto label_1;
-}
-label_0:;
-// generate_LoadQmlContextPropertyLookup
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(23);
-#endif
-while (!aotContext->loadContextIdLookup(22, &s.v2_21)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(23);
-#endif
-aotContext->initLoadContextIdLookup(22);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-{
-}
-// generate_StoreReg
-{
-}
-// generate_LoadZero
-s.v2_25 = double(0);
-{
-}
-{
-}
-// generate_SetLookup
-{
-#ifndef QT_NO_DEBUG
-aotContext->setInstructionPointer(31);
-#endif
-while (!aotContext->setObjectLookup(23, s.v2_21, &s.v2_25)) {
-#ifdef QT_NO_DEBUG
-aotContext->setInstructionPointer(31);
-#endif
-aotContext->initSetObjectLookup(23, s.v2_21);
-if (aotContext->engine->hasError()) {
-aotContext->setReturnValueUndefined();
-return;
-}
-}
-}
-{
-}
-{
-}
-label_1:;
-// generate_PopContext
-{}
-}
-{
-}
-{
-}
-// generate_Ret
-return;
-}
- },{ 0, 0, nullptr, nullptr }};
-QT_WARNING_POP
-}
-}
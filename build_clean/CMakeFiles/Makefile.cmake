@@ -1,942 +0,0 @@
-# CMAKE generated file: DO NOT EDIT!
-# Generated by "Unix Makefiles" Generator, CMake Version 3.25
-
-# The generator used is:
-set(CMAKE_DEPENDS_GENERATOR "Unix Makefiles")
-
-# The top level Makefile was generated from the following files:
-set(CMAKE_MAKEFILE_DEPENDS
-  "CMakeCache.txt"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/FindWrapAtomic.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/FindWrapOpenGL.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/FindWrapVulkanHeaders.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6Config.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6ConfigExtras.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6ConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6ConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6Dependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6Targets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/Qt6VersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtFeature.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtFeatureCommon.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtInstallPaths.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicAndroidHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicAppleHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicCMakeEarlyPolicyHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicCMakeHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicCMakeVersionHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicDependencyHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicExternalProjectHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicFinalizerHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicFindPackageHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicGitHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicPluginHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicPluginHelpers_v2.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomAttributionHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomCommonGenerationHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomCpeHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomCycloneDXHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomDepHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomDocumentNamespaceHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomFileHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomGenerationCycloneDXHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomGenerationHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomLicenseHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomOpsHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomPurlHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomPythonHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomQtEntityHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicSbomSystemDepHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicTargetHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicTestHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicToolHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicWalkLibsHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6/QtPublicWindowsHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Concurrent/Qt6ConcurrentVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreConfigExtras.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreConfigureFileTemplate.in"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreMacros.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Core/Qt6CoreVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6CoreTools/Qt6CoreToolsVersionlessTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusMacros.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBus/Qt6DBusVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6DBusTools/Qt6DBusToolsVersionlessTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6ExamplesAssetDownloaderPrivate/Qt6ExamplesAssetDownloaderPrivateVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiPlugins.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6GuiVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QComposePlatformInputContextPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QComposePlatformInputContextPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QComposePlatformInputContextPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QComposePlatformInputContextPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSEmulatorIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSEmulatorIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSEmulatorIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSEmulatorIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsEglDeviceIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsEglDeviceIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsEglDeviceIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsEglDeviceIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsGbmIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsGbmIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsGbmIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSKmsGbmIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSX11IntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSX11IntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSX11IntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEglFSX11IntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevKeyboardPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevKeyboardPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevKeyboardPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevKeyboardPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevMousePluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevMousePluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevMousePluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevMousePluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTabletPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTabletPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTabletPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTabletPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTouchScreenPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTouchScreenPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTouchScreenPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QEvdevTouchScreenPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGifPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGifPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGifPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGifPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGtk3ThemePluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGtk3ThemePluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGtk3ThemePluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QGtk3ThemePluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICNSPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICNSPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICNSPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICNSPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICOPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICOPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICOPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QICOPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QIbusPlatformInputContextPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QIbusPlatformInputContextPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QIbusPlatformInputContextPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QIbusPlatformInputContextPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QJpegPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QJpegPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QJpegPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QJpegPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QLinuxFbIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QLinuxFbIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QLinuxFbIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QLinuxFbIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalEglIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalEglIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalEglIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalEglIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QMinimalIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QOffscreenIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QOffscreenIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QOffscreenIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QOffscreenIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgIconPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgIconPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgIconPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgIconPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QSvgPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTgaPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTgaPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTgaPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTgaPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTiffPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTiffPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTiffPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTiffPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTuioTouchPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTuioTouchPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTuioTouchPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QTuioTouchPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVirtualKeyboardPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVirtualKeyboardPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVirtualKeyboardPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVirtualKeyboardPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVkKhrDisplayIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVkKhrDisplayIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVkKhrDisplayIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVkKhrDisplayIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVncIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVncIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVncIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QVncIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWaylandIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWaylandIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWaylandIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWaylandIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWbmpPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWbmpPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWbmpPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWbmpPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWebpPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWebpPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWebpPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QWebpPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbEglIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbEglIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbEglIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbEglIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbGlxIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbGlxIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbGlxIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbGlxIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbIntegrationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbIntegrationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbIntegrationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXcbIntegrationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXdgDesktopPortalThemePluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXdgDesktopPortalThemePluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXdgDesktopPortalThemePluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Gui/Qt6QXdgDesktopPortalThemePluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6GuiTools/Qt6GuiToolsVersionlessTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkPlugins.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6NetworkVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QGlibNetworkInformationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QGlibNetworkInformationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QGlibNetworkInformationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QGlibNetworkInformationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QNetworkManagerNetworkInformationPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QNetworkManagerNetworkInformationPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QNetworkManagerNetworkInformationPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QNetworkManagerNetworkInformationPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendCertOnlyPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendCertOnlyPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendCertOnlyPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendCertOnlyPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendOpenSSLPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendOpenSSLPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendOpenSSLPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Network/Qt6QTlsBackendOpenSSLPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6OpenGL/Qt6OpenGLVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6DataVisualizationQmlpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6DataVisualizationQmlpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6DataVisualizationQmlpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6DataVisualizationQmlpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6GraphspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6GraphspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6GraphspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6GraphspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsPlatformpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsPlatformpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsPlatformpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsPlatformpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsSynchronizerpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsSynchronizerpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsSynchronizerpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LabsSynchronizerpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottieVectorImageHelperspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottieVectorImageHelperspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottieVectorImageHelperspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottieVectorImageHelperspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottiepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottiepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottiepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6LottiepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlAssetDownloaderpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlAssetDownloaderpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlAssetDownloaderpluginDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlAssetDownloaderpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlAssetDownloaderpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlNetworkpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlNetworkpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlNetworkpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QmlNetworkpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6Quick3DXrpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6Quick3DXrpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6Quick3DXrpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6Quick3DXrpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickControlsTestUtilsPrivatepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickControlsTestUtilsPrivatepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickControlsTestUtilsPrivatepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickControlsTestUtilsPrivatepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickTestpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickTestpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickTestpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6QuickTestpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6SensorsQuickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6SensorsQuickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6SensorsQuickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6SensorsQuickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6TextToSpeechQmlAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6TextToSpeechQmlConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6TextToSpeechQmlTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6TextToSpeechQmlTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6VirtualKeyboardpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6VirtualKeyboardpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6VirtualKeyboardpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6VirtualKeyboardpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorIviapplicationpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorIviapplicationpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorIviapplicationpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorIviapplicationpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorPresentationTimepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorPresentationTimepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorPresentationTimepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorPresentationTimepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorQtShellAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorQtShellConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorQtShellTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorQtShellTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorWLShellpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorWLShellpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorWLShellpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorWLShellpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorXdgShellpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorXdgShellpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorXdgShellpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandCompositorXdgShellpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingExtensionAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingExtensionConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingExtensionTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingExtensionTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WaylandTextureSharingTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WebChannelQuickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WebChannelQuickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WebChannelQuickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6WebChannelQuickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_locationAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_locationConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_locationTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_locationTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_remoteobjectsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_remoteobjectsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_remoteobjectsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_remoteobjectsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_scxmlAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_scxmlConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_scxmlTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6declarative_scxmlTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6effectspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6effectspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6effectspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6effectspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6grpcquickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6grpcquickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6grpcquickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6grpcquickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsanimationpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsanimationpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsanimationpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsanimationpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsmodelspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsmodelspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsmodelspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6labsmodelspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6modelspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6modelspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6modelspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6modelspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6particlespluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6particlespluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6particlespluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6particlespluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6positioningquickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6positioningquickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6positioningquickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6positioningquickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6protobufquickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6protobufquickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6protobufquickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6protobufquickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlfolderlistmodelpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlfolderlistmodelpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlfolderlistmodelpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlfolderlistmodelpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmllocalstoragepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmllocalstoragepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmllocalstoragepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmllocalstoragepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlsettingspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlsettingspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlsettingspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlsettingspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlshapespluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlshapespluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlshapespluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlshapespluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwavefrontmeshpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwavefrontmeshpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwavefrontmeshpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwavefrontmeshpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwebsocketsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwebsocketsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwebsocketsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlwebsocketsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlxmllistmodelpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlxmllistmodelpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlxmllistmodelpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qmlxmllistmodelpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dphysicspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dphysicspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dphysicspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dphysicspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquick3dpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquicklayoutspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquicklayoutspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquicklayoutspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquicklayoutspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagehelperspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagehelperspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagehelperspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagehelperspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qquickvectorimagepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtchartsqml2AdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtchartsqml2Config.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtchartsqml2Targets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtchartsqml2Targets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectsprivateAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectsprivateConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectsprivateTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtgraphicaleffectsprivateTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlcorepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlcorepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlcorepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlcorepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlstatemachineAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlstatemachineConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlstatemachineTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtqmlstatemachineTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick2pluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick2pluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick2pluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick2pluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dassetutilspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dassetutilspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dassetutilspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dassetutilspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3deffectpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3deffectpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3deffectpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3deffectpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelpersimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelpersimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelpersimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelpersimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelperspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelperspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelperspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dhelperspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticleeffectspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticleeffectspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticleeffectspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticleeffectspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticles3dpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticles3dpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticles3dpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dparticles3dpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dphysicshelperspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dphysicshelperspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dphysicshelperspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquick3dphysicshelperspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstyleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstyleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstyleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstyleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2basicstylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3styleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3styleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3styleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3styleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3stylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3stylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3stylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fluentwinui3stylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstyleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstyleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstyleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstyleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2fusionstylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestyleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestyleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestyleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestyleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2imaginestylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2implpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2implpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2implpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2implpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstyleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstyleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstyleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstyleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2materialstylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2pluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2pluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2pluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2pluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstyleimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstyleimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstyleimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstyleimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstylepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstylepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstylepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickcontrols2universalstylepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogs2quickimplpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogs2quickimplpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogs2quickimplpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogs2quickimplpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickdialogspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene2dpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene2dpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene2dpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene2dpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene3dpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene3dpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene3dpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickscene3dpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickshapesdesignhelperspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickshapesdesignhelperspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickshapesdesignhelperspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquickshapesdesignhelperspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktemplates2pluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktemplates2pluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktemplates2pluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktemplates2pluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelineblendtreespluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelineblendtreespluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelineblendtreespluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelineblendtreespluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelinepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelinepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelinepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtquicktimelinepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbbuiltinstylespluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbbuiltinstylespluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbbuiltinstylespluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbbuiltinstylespluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbcomponentspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbcomponentspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbcomponentspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbcomponentspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbhangulpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbhangulpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbhangulpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbhangulpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkblayoutspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkblayoutspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkblayoutspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkblayoutspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbopenwnnpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbopenwnnpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbopenwnnpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbopenwnnpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpinyinpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpinyinpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpinyinpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpinyinpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbpluginspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbsettingspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbsettingspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbsettingspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbsettingspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbstylespluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbstylespluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbstylespluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbstylespluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbtcimepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbtcimepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbtcimepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbtcimepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbthaipluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbthaipluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbthaipluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtvkbthaipluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtwebviewquickpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtwebviewquickpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtwebviewquickpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qtwebviewquickpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3danimationpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3danimationpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3danimationpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3danimationpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dcorepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dcorepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dcorepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dcorepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dextraspluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dextraspluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dextraspluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dextraspluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dinputpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dinputpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dinputpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dinputpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dlogicpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dlogicpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dlogicpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dlogicpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3drenderpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3drenderpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3drenderpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3drenderpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dspatialaudioAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dspatialaudioConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dspatialaudioTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quick3dspatialaudioTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickmultimediaAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickmultimediaConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickmultimediaTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickmultimediaTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quicktoolingAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quicktoolingConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quicktoolingTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quicktoolingTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickwindowAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickwindowConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickwindowTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6quickwindowTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qwaylandcompositorpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qwaylandcompositorpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qwaylandcompositorpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6qwaylandcompositorpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6sharedimagepluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6sharedimagepluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6sharedimagepluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6sharedimagepluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6workerscriptpluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6workerscriptpluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6workerscriptpluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/QmlPlugins/Qt6workerscriptpluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QDebugMessageServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QDebugMessageServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QDebugMessageServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QDebugMessageServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QLocalClientConnectionFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QLocalClientConnectionFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QLocalClientConnectionFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QLocalClientConnectionFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebugServerFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebugServerFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebugServerFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebugServerFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebuggerServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebuggerServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebuggerServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlDebuggerServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlInspectorServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlInspectorServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlInspectorServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlInspectorServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugConnectorFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugConnectorFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugConnectorFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugConnectorFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlNativeDebugServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlPreviewServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlPreviewServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlPreviewServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlPreviewServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlProfilerServiceFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlProfilerServiceFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlProfilerServiceFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQmlProfilerServiceFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuick3DProfilerAdapterFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuick3DProfilerAdapterFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuick3DProfilerAdapterFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuick3DProfilerAdapterFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuickProfilerAdapterFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuickProfilerAdapterFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuickProfilerAdapterFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QQuickProfilerAdapterFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QTcpServerConnectionFactoryPluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QTcpServerConnectionFactoryPluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QTcpServerConnectionFactoryPluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QTcpServerConnectionFactoryPluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlConfigExtras.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlFindQmlscInternal.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlMacros.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlModuleDirMappingTemplate.qrc.in"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlPlugins.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlProperties.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlPublicCMakeHelpers.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6QmlVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Qml/Qt6qmldirTemplate.cmake.in"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlAssetDownloader/Qt6QmlAssetDownloaderVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlIntegration/Qt6QmlIntegrationVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlMeta/Qt6QmlMetaVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlModels/Qt6QmlModelsVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlTools/Qt6QmlToolsVersionlessTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QmlWorkerScript/Qt6QmlWorkerScriptVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QLottieVectorImagePluginAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QLottieVectorImagePluginConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QLottieVectorImagePluginTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QLottieVectorImagePluginTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickPlugins.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6Quick/Qt6QuickVersionlessAliasTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsAdditionalTargetInfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsConfig.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsConfigVersion.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsConfigVersionImpl.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsDependencies.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsTargets-relwithdebinfo.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsTargets.cmake"
-  "/data/Qt/6.10.2/gcc_64/lib/cmake/Qt6QuickTools/Qt6QuickToolsVersionlessTargets.cmake"
-  "/data/projects/PixelPilot/CMakeLists.txt"
-  "CMakeFiles/3.25.1/CMakeCCompiler.cmake"
-  "CMakeFiles/3.25.1/CMakeCXXCompiler.cmake"
-  "CMakeFiles/3.25.1/CMakeSystem.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeCInformation.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeCXXInformation.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeCheckCompilerFlagCommonPatterns.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeCommonLanguageInclude.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeFindDependencyMacro.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeGenericSystem.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeInitializeConfigs.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeLanguageInformation.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInformation.cmake"
-  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInitialize.cmake"
-  "/usr/share/cmake-3.25/Modules/CheckCSourceCompiles.cmake"
-  "/usr/share/cmake-3.25/Modules/CheckCXXCompilerFlag.cmake"
-  "/usr/share/cmake-3.25/Modules/CheckCXXSourceCompiles.cmake"
-  "/usr/share/cmake-3.25/Modules/CheckIncludeFile.cmake"
-  "/usr/share/cmake-3.25/Modules/CheckLibraryExists.cmake"
-  "/usr/share/cmake-3.25/Modules/Compiler/CMakeCommonCompilerMacros.cmake"
-  "/usr/share/cmake-3.25/Modules/Compiler/GNU-C.cmake"
-  "/usr/share/cmake-3.25/Modules/Compiler/GNU-CXX.cmake"
-  "/usr/share/cmake-3.25/Modules/Compiler/GNU.cmake"
-  "/usr/share/cmake-3.25/Modules/FindOpenGL.cmake"
-  "/usr/share/cmake-3.25/Modules/FindPackageHandleStandardArgs.cmake"
-  "/usr/share/cmake-3.25/Modules/FindPackageMessage.cmake"
-  "/usr/share/cmake-3.25/Modules/FindThreads.cmake"
-  "/usr/share/cmake-3.25/Modules/FindVulkan.cmake"
-  "/usr/share/cmake-3.25/Modules/GNUInstallDirs.cmake"
-  "/usr/share/cmake-3.25/Modules/Internal/CheckCompilerFlag.cmake"
-  "/usr/share/cmake-3.25/Modules/Internal/CheckFlagCommonConfig.cmake"
-  "/usr/share/cmake-3.25/Modules/Internal/CheckSourceCompiles.cmake"
-  "/usr/share/cmake-3.25/Modules/MacroAddFileDependencies.cmake"
-  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-C.cmake"
-  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-CXX.cmake"
-  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU.cmake"
-  "/usr/share/cmake-3.25/Modules/Platform/Linux.cmake"
-  "/usr/share/cmake-3.25/Modules/Platform/UnixPaths.cmake"
-  )
-
-# The corresponding makefile is:
-set(CMAKE_MAKEFILE_OUTPUTS
-  "Makefile"
-  "CMakeFiles/cmake.check_cache"
-  )
-
-# Byproducts of CMake generate step:
-set(CMAKE_MAKEFILE_PRODUCTS
-  ".qt/rcc/qmake_PixelPilot.qrc"
-  "PixelPilot/PixelPilotApp_qml_module_dir_map.qrc"
-  ".qt/rcc/PixelPilotApp_raw_qml_0.qrc"
-  "PixelPilot/qmldir"
-  "CMakeFiles/PixelPilotApp_autogen.dir/AutogenInfo.json"
-  ".qt/QtDeploySupport.cmake"
-  "qmltypes/PixelPilotApp_foreign_types.txt"
-  ".rcc/qmllint/PixelPilotApp.rsp"
-  ".rcc/qmllint/PixelPilotApp_json.rsp"
-  ".rcc/qmllint/PixelPilotApp_module.rsp"
-  ".rcc/qmlcache/PixelPilotApp_qml_loader_file_list.rsp"
-  ".qt/PixelPilotApp_qml.cmake"
-  ".qt/PixelPilotApp_res.cmake"
-  ".qt/QtDeployTargets.cmake"
-  "CMakeFiles/CMakeDirectoryInformation.cmake"
-  )
-
-# Dependency information for all targets:
-set(CMAKE_DEPEND_INFO_FILES
-  "CMakeFiles/PixelPilotApp.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_automoc_json_extraction.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_qmltyperegistration.dir/DependInfo.cmake"
-  "CMakeFiles/all_qmltyperegistrations.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_other_files.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_qmllint.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_qmllint_json.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_qmllint_module.dir/DependInfo.cmake"
-  "CMakeFiles/all_qmllint.dir/DependInfo.cmake"
-  "CMakeFiles/all_qmllint_json.dir/DependInfo.cmake"
-  "CMakeFiles/all_qmllint_module.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_copy_qml.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_copy_res.dir/DependInfo.cmake"
-  "CMakeFiles/generate_qmlls_build_ini_file.dir/DependInfo.cmake"
-  "CMakeFiles/module_PixelPilotApp_aotstats_target.dir/DependInfo.cmake"
-  "CMakeFiles/all_aotstats.dir/DependInfo.cmake"
-  "CMakeFiles/PixelPilotApp_autogen.dir/DependInfo.cmake"
-  )
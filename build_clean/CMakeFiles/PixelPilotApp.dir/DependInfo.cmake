@@ -1,39 +0,0 @@
-
-# Consider dependencies only in project.
-set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
-
-# The set of languages for which implicit dependencies are needed:
-set(CMAKE_DEPENDS_LANGUAGES
-  )
-
-# The set of dependency files which are needed:
-set(CMAKE_DEPENDS_DEPENDENCY_FILES
-  "/data/projects/PixelPilot/build_clean/PixelPilotApp_autogen/mocs_compilation.cpp" "CMakeFiles/PixelPilotApp.dir/PixelPilotApp_autogen/mocs_compilation.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/PixelPilotApp_autogen/mocs_compilation.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.qt/rcc/qrc_qmake_PixelPilot.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_qmake_PixelPilot.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_qmake_PixelPilot.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.o.d"
-  "/data/projects/PixelPilot/build_clean/pixelpilotapp_qmltyperegistrations.cpp" "CMakeFiles/PixelPilotApp.dir/pixelpilotapp_qmltyperegistrations.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/pixelpilotapp_qmltyperegistrations.cpp.o.d"
-  "/data/projects/PixelPilot/src/backend/WaylandScreenGrabber.cpp" "CMakeFiles/PixelPilotApp.dir/src/backend/WaylandScreenGrabber.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/src/backend/WaylandScreenGrabber.cpp.o.d"
-  "/data/projects/PixelPilot/src/main.cpp" "CMakeFiles/PixelPilotApp.dir/src/main.cpp.o" "gcc" "CMakeFiles/PixelPilotApp.dir/src/main.cpp.o.d"
-  )
-
-# Pairs of files generated by the same build rule.
-set(CMAKE_MULTIPLE_OUTPUT_PAIRS
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/PixelPilot/PixelPilotApp.qmltypes" "/data/projects/PixelPilot/build_clean/pixelpilotapp_qmltyperegistrations.cpp"
-  )
-
-
-# Targets to which this target links.
-set(CMAKE_TARGET_LINKED_INFO_FILES
-  )
-
-# Fortran module output directory.
-set(CMAKE_Fortran_TARGET_MODULE_DIR "")
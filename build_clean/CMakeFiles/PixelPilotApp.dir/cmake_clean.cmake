@@ -1,49 +0,0 @@
-file(REMOVE_RECURSE
-  ".qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp"
-  ".qt/rcc/qrc_qmake_PixelPilot.cpp"
-  ".rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.aotstats"
-  "CMakeFiles/PixelPilotApp_autogen.dir/AutogenUsed.txt"
-  "CMakeFiles/PixelPilotApp_autogen.dir/ParseCache.txt"
-  "PixelPilotApp_autogen"
-  "CMakeFiles/PixelPilotApp.dir/PixelPilotApp_autogen/mocs_compilation.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/PixelPilotApp_autogen/mocs_compilation.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_PixelPilotApp_raw_qml_0.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_qmake_PixelPilot.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.qt/rcc/qrc_qmake_PixelPilot.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_qmlcache_loader.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/pixelpilotapp_qmltyperegistrations.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/pixelpilotapp_qmltyperegistrations.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/src/backend/WaylandScreenGrabber.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/src/backend/WaylandScreenGrabber.cpp.o.d"
-  "CMakeFiles/PixelPilotApp.dir/src/main.cpp.o"
-  "CMakeFiles/PixelPilotApp.dir/src/main.cpp.o.d"
-  "PixelPilot/PixelPilotApp.qmltypes"
-  "PixelPilotApp"
-  "PixelPilotApp.pdb"
-  "meta_types/qt6pixelpilotapp_metatypes.json"
-  "meta_types/qt6pixelpilotapp_metatypes.json.gen"
-  "pixelpilotapp_qmltyperegistrations.cpp"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang CXX)
-  include(CMakeFiles/PixelPilotApp.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
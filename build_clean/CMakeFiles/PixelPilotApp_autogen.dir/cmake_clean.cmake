@@ -1,9 +0,0 @@
-file(REMOVE_RECURSE
-  "CMakeFiles/PixelPilotApp_autogen"
-  "PixelPilotApp_autogen/mocs_compilation.cpp"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_autogen.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
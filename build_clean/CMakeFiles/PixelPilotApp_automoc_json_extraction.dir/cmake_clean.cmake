@@ -1,10 +0,0 @@
-file(REMOVE_RECURSE
-  "CMakeFiles/PixelPilotApp_automoc_json_extraction"
-  "meta_types/PixelPilotApp_json_file_list.txt"
-  "meta_types/PixelPilotApp_json_file_list.txt.timestamp"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_automoc_json_extraction.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
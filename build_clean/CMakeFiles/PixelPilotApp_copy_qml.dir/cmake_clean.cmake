@@ -1,9 +0,0 @@
-file(REMOVE_RECURSE
-  ".qt/PixelPilotApp_qml.txt"
-  "CMakeFiles/PixelPilotApp_copy_qml"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_copy_qml.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,9 +0,0 @@
-file(REMOVE_RECURSE
-  ".qt/PixelPilotApp_res.txt"
-  "CMakeFiles/PixelPilotApp_copy_res"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_copy_res.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,5 +0,0 @@
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_other_files.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,8 +0,0 @@
-file(REMOVE_RECURSE
-  "CMakeFiles/PixelPilotApp_qmllint"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_qmllint.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,8 +0,0 @@
-file(REMOVE_RECURSE
-  "CMakeFiles/PixelPilotApp_qmllint_json"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_qmllint_json.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
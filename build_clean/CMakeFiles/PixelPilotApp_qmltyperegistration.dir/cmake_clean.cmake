@@ -1,12 +0,0 @@
-file(REMOVE_RECURSE
-  "CMakeFiles/PixelPilotApp_qmltyperegistration"
-  "PixelPilot/PixelPilotApp.qmltypes"
-  "meta_types/qt6pixelpilotapp_metatypes.json"
-  "meta_types/qt6pixelpilotapp_metatypes.json.gen"
-  "pixelpilotapp_qmltyperegistrations.cpp"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/PixelPilotApp_qmltyperegistration.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,10 +0,0 @@
-file(REMOVE_RECURSE
-  ".rcc/qmlcache/all_aotstats.aotstats"
-  ".rcc/qmlcache/all_aotstats.txt"
-  "CMakeFiles/all_aotstats"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/all_aotstats.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
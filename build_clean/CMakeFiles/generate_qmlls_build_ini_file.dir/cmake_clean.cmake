@@ -1,9 +0,0 @@
-file(REMOVE_RECURSE
-  ".qt/.qmlls.build.ini"
-  "CMakeFiles/generate_qmlls_build_ini_file"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/generate_qmlls_build_ini_file.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
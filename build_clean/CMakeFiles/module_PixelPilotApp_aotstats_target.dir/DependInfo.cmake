@@ -1,27 +0,0 @@
-
-# Consider dependencies only in project.
-set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
-
-# The set of languages for which implicit dependencies are needed:
-set(CMAKE_DEPENDS_LANGUAGES
-  )
-
-# The set of dependency files which are needed:
-set(CMAKE_DEPENDS_DEPENDENCY_FILES
-  )
-
-# Pairs of files generated by the same build rule.
-set(CMAKE_MULTIPLE_OUTPUT_PAIRS
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp"
-  "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.aotstats" "/data/projects/PixelPilot/build_clean/.rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp"
-  )
-
-
-# Targets to which this target links.
-set(CMAKE_TARGET_LINKED_INFO_FILES
-  )
-
-# Fortran module output directory.
-set(CMAKE_Fortran_TARGET_MODULE_DIR "")
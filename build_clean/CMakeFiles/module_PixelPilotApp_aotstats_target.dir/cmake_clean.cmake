@@ -1,17 +0,0 @@
-file(REMOVE_RECURSE
-  ".rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/Main_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/NodeGraph_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/GridBackground_qml.cpp.aotstats"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp"
-  ".rcc/qmlcache/PixelPilotApp_src/ui/components/NodeBlock_qml.cpp.aotstats"
-  ".rcc/qmlcache/module_PixelPilotApp.aotstats"
-  "CMakeFiles/module_PixelPilotApp_aotstats_target"
-)
-
-# Per-language clean rules from dependency scanning.
-foreach(lang )
-  include(CMakeFiles/module_PixelPilotApp_aotstats_target.dir/cmake_clean_${lang}.cmake OPTIONAL)
-endforeach()
@@ -1,140 +0,0 @@
-/****************************************************************************
-** Meta object code from reading C++ file 'WaylandScreenGrabber.h'
-**
-** Created by: The Qt Meta Object Compiler version 69 (Qt 6.10.2)
-**
-** WARNING! All changes made in this file will be lost!
-*****************************************************************************/
-
-#include "../../../src/backend/WaylandScreenGrabber.h"
-#include <QtCore/qmetatype.h>
-
-#include <QtCore/qtmochelpers.h>
-
-#include <memory>
-
-
-#include <QtCore/qxptype_traits.h>
-#if !defined(Q_MOC_OUTPUT_REVISION)
-#error "The header file 'WaylandScreenGrabber.h' doesn't include <QObject>."
-#elif Q_MOC_OUTPUT_REVISION != 69
-#error "This file was generated using the moc from 6.10.2. It"
-#error "cannot be used with the include files from this version of Qt."
-#error "(The moc has changed too much.)"
-#endif
-
-#ifndef Q_CONSTINIT
-#define Q_CONSTINIT
-#endif
-
-QT_WARNING_PUSH
-QT_WARNING_DISABLE_DEPRECATED
-QT_WARNING_DISABLE_GCC("-Wuseless-cast")
-namespace {
-struct qt_meta_tag_ZN20WaylandScreenGrabberE_t {};
-} // unnamed namespace
-
-template <> constexpr inline auto WaylandScreenGrabber::qt_create_metaobjectdata<qt_meta_tag_ZN20WaylandScreenGrabberE_t>()
-{
-    namespace QMC = QtMocConstants;
-    QtMocHelpers::StringRefStorage qt_stringData {
-        "WaylandScreenGrabber",
-        "sessionCreated",
-        "",
-        "path",
-        "errorOccurred",
-        "message",
-        "initCapture"
-    };
-
-    QtMocHelpers::UintData qt_methods {
-        // Signal 'sessionCreated'
-        QtMocHelpers::SignalData<void(QString)>(1, 2, QMC::AccessPublic, QMetaType::Void, {{
-            { QMetaType::QString, 3 },
-        }}),
-        // Signal 'errorOccurred'
-        QtMocHelpers::SignalData<void(QString)>(4, 2, QMC::AccessPublic, QMetaType::Void, {{
-            { QMetaType::QString, 5 },
-        }}),
-        // Slot 'initCapture'
-        QtMocHelpers::SlotData<void()>(6, 2, QMC::AccessPublic, QMetaType::Void),
-    };
-    QtMocHelpers::UintData qt_properties {
-    };
-    QtMocHelpers::UintData qt_enums {
-    };
-    return QtMocHelpers::metaObjectData<WaylandScreenGrabber, qt_meta_tag_ZN20WaylandScreenGrabberE_t>(QMC::MetaObjectFlag{}, qt_stringData,
-            qt_methods, qt_properties, qt_enums);
-}
-Q_CONSTINIT const QMetaObject WaylandScreenGrabber::staticMetaObject = { {
-    QMetaObject::SuperData::link<QObject::staticMetaObject>(),
-    qt_staticMetaObjectStaticContent<qt_meta_tag_ZN20WaylandScreenGrabberE_t>.stringdata,
-    qt_staticMetaObjectStaticContent<qt_meta_tag_ZN20WaylandScreenGrabberE_t>.data,
-    qt_static_metacall,
-    nullptr,
-    qt_staticMetaObjectRelocatingContent<qt_meta_tag_ZN20WaylandScreenGrabberE_t>.metaTypes,
-    nullptr
-} };
-
-void WaylandScreenGrabber::qt_static_metacall(QObject *_o, QMetaObject::Call _c, int _id, void **_a)
-{
-    auto *_t = static_cast<WaylandScreenGrabber *>(_o);
-    if (_c == QMetaObject::InvokeMetaMethod) {
-        switch (_id) {
-        case 0: _t->sessionCreated((*reinterpret_cast<std::add_pointer_t<QString>>(_a[1]))); break;
-        case 1: _t->errorOccurred((*reinterpret_cast<std::add_pointer_t<QString>>(_a[1]))); break;
-        case 2: _t->initCapture(); break;
-        default: ;
-        }
-    }
-    if (_c == QMetaObject::IndexOfMethod) {
-        if (QtMocHelpers::indexOfMethod<void (WaylandScreenGrabber::*)(QString )>(_a, &WaylandScreenGrabber::sessionCreated, 0))
-            return;
-        if (QtMocHelpers::indexOfMethod<void (WaylandScreenGrabber::*)(QString )>(_a, &WaylandScreenGrabber::errorOccurred, 1))
-            return;
-    }
-}
-
-const QMetaObject *WaylandScreenGrabber::metaObject() const
-{
-    return QObject::d_ptr->metaObject ? QObject::d_ptr->dynamicMetaObject() : &staticMetaObject;
-}
-
-void *WaylandScreenGrabber::qt_metacast(const char *_clname)
-{
-    if (!_clname) return nullptr;
-    if (!strcmp(_clname, qt_staticMetaObjectStaticContent<qt_meta_tag_ZN20WaylandScreenGrabberE_t>.strings))
-        return static_cast<void*>(this);
-    return QObject::qt_metacast(_clname);
-}
-
-int WaylandScreenGrabber::qt_metacall(QMetaObject::Call _c, int _id, void **_a)
-{
-    _id = QObject::qt_metacall(_c, _id, _a);
-    if (_id < 0)
-        return _id;
-    if (_c == QMetaObject::InvokeMetaMethod) {
-        if (_id < 3)
-            qt_static_metacall(this, _c, _id, _a);
-        _id -= 3;
-    }
-    if (_c == QMetaObject::RegisterMethodArgumentMetaType) {
-        if (_id < 3)
-            *reinterpret_cast<QMetaType *>(_a[0]) = QMetaType();
-        _id -= 3;
-    }
-    return _id;
-}
-
-// SIGNAL 0
-void WaylandScreenGrabber::sessionCreated(QString _t1)
-{
-    QMetaObject::activate<void>(this, &staticMetaObject, 0, nullptr, _t1);
-}
-
-// SIGNAL 1
-void WaylandScreenGrabber::errorOccurred(QString _t1)
-{
-    QMetaObject::activate<void>(this, &staticMetaObject, 1, nullptr, _t1);
-}
-QT_WARNING_POP
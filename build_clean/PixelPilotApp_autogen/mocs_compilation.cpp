@@ -1,2 +0,0 @@
-// This file is autogenerated. Changes will be overwritten.
-#include "VU2PALRVTW/moc_WaylandScreenGrabber.cpp"
@@ -1,131 +0,0 @@
-/****************************************************************************
-** Resource object code
-**
-** Created by: The Resource Compiler for Qt version 6.10.2
-**
-** WARNING! All changes made in this file will be lost!
-*****************************************************************************/
-
-#ifdef _MSC_VER
-// disable informational message "function ... selected for automatic inline expansion"
-#pragma warning (disable: 4711)
-#endif
-
-static const unsigned char qt_resource_data[] = {
-  // Main.qml
-  0x0,0x0,0x1,0x1b,
-  0x69,
-  0x6d,0x70,0x6f,0x72,0x74,0x20,0x51,0x74,0x51,0x75,0x69,0x63,0x6b,0xa,0x57,0x69,
-  0x6e,0x64,0x6f,0x77,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x77,0x69,0x64,0x74,0x68,
-  0x3a,0x20,0x36,0x34,0x30,0xa,0x20,0x20,0x20,0x20,0x68,0x65,0x69,0x67,0x68,0x74,
-  0x3a,0x20,0x34,0x38,0x30,0xa,0x20,0x20,0x20,0x20,0x76,0x69,0x73,0x69,0x62,0x6c,
-  0x65,0x3a,0x20,0x74,0x72,0x75,0x65,0xa,0x20,0x20,0x20,0x20,0x74,0x69,0x74,0x6c,
-  0x65,0x3a,0x20,0x22,0x50,0x69,0x78,0x65,0x6c,0x50,0x69,0x6c,0x6f,0x74,0x20,0x2d,
-  0x20,0x57,0x61,0x79,0x6c,0x61,0x6e,0x64,0x20,0x41,0x75,0x74,0x6f,0x6d,0x61,0x74,
-  0x69,0x6f,0x6e,0x22,0xa,0x20,0x20,0x20,0x20,0x63,0x6f,0x6c,0x6f,0x72,0x3a,0x20,
-  0x22,0x23,0x32,0x64,0x32,0x64,0x32,0x64,0x22,0xa,0x20,0x20,0x20,0x20,0x54,0x65,
-  0x78,0x74,0x20,0x7b,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x61,0x6e,0x63,
-  0x68,0x6f,0x72,0x73,0x2e,0x63,0x65,0x6e,0x74,0x65,0x72,0x49,0x6e,0x3a,0x20,0x70,
-  0x61,0x72,0x65,0x6e,0x74,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x74,0x65,
-  0x78,0x74,0x3a,0x20,0x22,0x50,0x69,0x78,0x65,0x6c,0x50,0x69,0x6c,0x6f,0x74,0x20,
-  0x42,0x61,0x63,0x6b,0x65,0x6e,0x64,0x20,0x52,0x75,0x6e,0x6e,0x69,0x6e,0x67,0x22,
-  0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x63,0x6f,0x6c,0x6f,0x72,0x3a,0x20,
-  0x22,0x77,0x68,0x69,0x74,0x65,0x22,0xa,0x20,0x20,0x20,0x20,0x20,0x20,0x20,0x20,
-  0x66,0x6f,0x6e,0x74,0x2e,0x70,0x69,0x78,0x65,0x6c,0x53,0x69,0x7a,0x65,0x3a,0x20,
-  0x32,0x34,0xa,0x20,0x20,0x20,0x20,0x7d,0xa,0x7d,
-  
-};
-
-static const unsigned char qt_resource_name[] = {
-  // src
-  0x0,0x3,
-  0x0,0x0,0x7a,0x83,
-  0x0,0x73,
-  0x0,0x72,0x0,0x63,
-    // ui
-  0x0,0x2,
-  0x0,0x0,0x7,0xb9,
-  0x0,0x75,
-  0x0,0x69,
-    // Main.qml
-  0x0,0x8,
-  0x8,0x1,0x5e,0x5c,
-  0x0,0x4d,
-  0x0,0x61,0x0,0x69,0x0,0x6e,0x0,0x2e,0x0,0x71,0x0,0x6d,0x0,0x6c,
-  
-};
-
-static const unsigned char qt_resource_struct[] = {
-  // :
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/src
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x2,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/src/ui
-  0x0,0x0,0x0,0xc,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x3,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/src/ui/Main.qml
-  0x0,0x0,0x0,0x16,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x1,0x9c,0x22,0xf5,0xa9,0xdd,
-
-};
-
-#ifdef QT_NAMESPACE
-#  define QT_RCC_PREPEND_NAMESPACE(name) ::QT_NAMESPACE::name
-#  define QT_RCC_MANGLE_NAMESPACE0(x) x
-#  define QT_RCC_MANGLE_NAMESPACE1(a, b) a##_##b
-#  define QT_RCC_MANGLE_NAMESPACE2(a, b) QT_RCC_MANGLE_NAMESPACE1(a,b)
-#  define QT_RCC_MANGLE_NAMESPACE(name) QT_RCC_MANGLE_NAMESPACE2( \
-        QT_RCC_MANGLE_NAMESPACE0(name), QT_RCC_MANGLE_NAMESPACE0(QT_NAMESPACE))
-#else
-#   define QT_RCC_PREPEND_NAMESPACE(name) name
-#   define QT_RCC_MANGLE_NAMESPACE(name) name
-#endif
-
-#if defined(QT_INLINE_NAMESPACE)
-inline namespace QT_NAMESPACE {
-#elif defined(QT_NAMESPACE)
-namespace QT_NAMESPACE {
-#endif
-
-bool qRegisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-bool qUnregisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-
-#ifdef QT_NAMESPACE
-}
-#endif
-
-int QT_RCC_MANGLE_NAMESPACE(qInitResources_qml)();
-int QT_RCC_MANGLE_NAMESPACE(qInitResources_qml)()
-{
-    int version = 3;
-    QT_RCC_PREPEND_NAMESPACE(qRegisterResourceData)
-        (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources_qml)();
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources_qml)()
-{
-    int version = 3;
-    QT_RCC_PREPEND_NAMESPACE(qUnregisterResourceData)
-       (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic push
-#   pragma clang diagnostic ignored "-Wexit-time-destructors"
-#endif
-
-namespace {
-   struct initializer {
-       initializer() { QT_RCC_MANGLE_NAMESPACE(qInitResources_qml)(); }
-       ~initializer() { QT_RCC_MANGLE_NAMESPACE(qCleanupResources_qml)(); }
-   } dummy;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic pop
-#endif
@@ -1,7 +1,14 @@
 #include "WaylandScreenGrabber.h"
 #include <QDBusConnection>
 #include <QDBusMessage>
+#include <QDBusPendingCall>
+#include <QDBusPendingCallWatcher>
 #include <QDebug>
+#include <QLoggingCategory>
+
+// qCDebug skips building the message when the category is disabled,
+// e.g. QT_LOGGING_RULES="pixelpilot.screengrabber.debug=false"
+Q_LOGGING_CATEGORY(lcScreenGrabber, "pixelpilot.screengrabber")
 
 WaylandScreenGrabber::WaylandScreenGrabber(QObject *parent)
     : QObject(parent)
@@ -10,7 +17,7 @@ WaylandScreenGrabber::WaylandScreenGrabber(QObject *parent)
 
 void WaylandScreenGrabber::initCapture()
 {
-    qDebug() << "Attempting to create Wayland screen capture session...";
+    qCDebug(lcScreenGrabber) << "Attempting to create Wayland screen capture session...";
 
     // Create DBus message to call org.freedesktop.portal.Desktop.CreateSession
     QDBusMessage message = QDBusMessage::createMethodCall(
@@ -27,18 +34,26 @@ void WaylandScreenGrabber::initCapture()
     
     message.setArguments(QVariantList() << options);
 
-    // Send the message and get reply
+    // Send the message asynchronously so the GUI thread keeps processing
+    // events while the portal answers
     QDBusConnection connection = QDBusConnection::sessionBus();
-    QDBusMessage reply = connection.call(message, QDBus::Block, 10000); // 10 second timeout
+    QDBusPendingCall pendingCall = connection.asyncCall(message, 10000); // 10 second timeout
+    auto *watcher = new QDBusPendingCallWatcher(pendingCall, this);
 
-    if (reply.type() == QDBusMessage::ReplyMessage) {
-        qDebug() << "DBus call successful!";
-        handleDBusResponse(reply);
-    } else {
-        QString errorMessage = QString("DBus call failed: %1").arg(reply.errorName());
-        qDebug() << errorMessage;
-        emit errorOccurred(errorMessage);
-    }
+    connect(watcher, &QDBusPendingCallWatcher::finished,
+            this, [this](QDBusPendingCallWatcher *call) {
+        call->deleteLater();
+        const QDBusMessage reply = call->reply();
+
+        if (reply.type() == QDBusMessage::ReplyMessage) {
+            qCDebug(lcScreenGrabber) << "DBus call successful!";
+            handleDBusResponse(reply);
+        } else {
+            QString errorMessage = QString("DBus call failed: %1").arg(reply.errorName());
+            qCWarning(lcScreenGrabber) << errorMessage;
+            emit errorOccurred(errorMessage);
+        }
+    });
 }
 
 void WaylandScreenGrabber::handleDBusResponse(const QDBusMessage &message)
@@ -47,7 +62,7 @@ void WaylandScreenGrabber::handleDBusResponse(const QDBusMessage &message)
     QList<QVariant> arguments = message.arguments();
     
     if (arguments.isEmpty()) {
-        qWarning() << "Empty DBus response";
+        qCWarning(lcScreenGrabber) << "Empty DBus response";
         return;
     }
     
@@ -59,12 +74,12 @@ void WaylandScreenGrabber::handleDBusResponse(const QDBusMessage &message)
         
         if (responseMap.contains("session_handle")) {
             QString sessionPath = responseMap["session_handle"].toString();
-            qDebug() << "Session created at path:" << sessionPath;
+            qCDebug(lcScreenGrabber) << "Session created at path:" << sessionPath;
             emit sessionCreated(sessionPath);
         } else {
-            qDebug() << "No session_handle found in response";
+            qCDebug(lcScreenGrabber) << "No session_handle found in response";
         }
     } else {
-        qDebug() << "Unexpected response type:" << firstArg.typeName();
+        qCDebug(lcScreenGrabber) << "Unexpected response type:" << firstArg.typeName();
     }
 }
\ No newline at end of file
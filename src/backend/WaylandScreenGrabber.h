@@ -2,9 +2,8 @@
 #define WAYLANDSCREENGABBER_H
 
 #include <QObject>
-#include <QDBusMessage>
-#include <QTimer>
-#include <QDebug>
+
+class QDBusMessage;
 
 class WaylandScreenGrabber : public QObject
 {
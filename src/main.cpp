@@ -1,11 +1,31 @@
 #include <QGuiApplication>
 #include <QQmlApplicationEngine>
+#include <QQuickWindow>
+#include <QElapsedTimer>
 #include <QTimer>
+#include <QDebug>
+#include <utility>
 #include "backend/WaylandScreenGrabber.h"
 
 int main(int argc, char *argv[]) {
+    // Set PIXELPILOT_PROFILE_STARTUP=1 to log the cost of each startup phase
+    const bool profileStartup = qEnvironmentVariableIsSet("PIXELPILOT_PROFILE_STARTUP");
+    QElapsedTimer startupTimer;
+    startupTimer.start();
+    qint64 phaseStart = 0;
+    auto logPhase = [&](const char *phase) {
+        if (!profileStartup)
+            return;
+        const qint64 now = startupTimer.elapsed();
+        qInfo().nospace() << "[startup] " << phase << ": " << now - phaseStart << " ms";
+        phaseStart = now;
+    };
+
     QGuiApplication app(argc, argv);
+    logPhase("QGuiApplication");
+    
     QQmlApplicationEngine engine;
+    logPhase("QML engine");
     
     // Load the QML file from the module URI
     const QUrl url(u"qrc:/PixelPilot/src/ui/Main.qml"_qs);
@@ -16,12 +36,40 @@ int main(int argc, char *argv[]) {
     }, Qt::QueuedConnection);
     
     engine.load(url);
+    logPhase("QML load");
     
     // Create and initialize the Wayland screen grabber
     WaylandScreenGrabber* screenGrabber = new WaylandScreenGrabber(&app);
     
-    // Initialize capture after the app starts (0ms delay)
-    QTimer::singleShot(0, screenGrabber, &WaylandScreenGrabber::initCapture);
+    // Initialize capture once the window has shown its first frame, so the
+    // portal handshake never delays first paint. A window that is never
+    // exposed (started minimised, on a hidden desktop) renders no frame, so
+    // a short timer starts capture anyway; whichever fires first wins.
+    bool captureStarted = false;
+    auto startCapture = [screenGrabber, &captureStarted]() {
+        if (std::exchange(captureStarted, true))
+            return;
+        screenGrabber->initCapture();
+    };
+    QTimer::singleShot(500, screenGrabber, startCapture);
+    
+    QQuickWindow* window = engine.rootObjects().isEmpty()
+        ? nullptr
+        : qobject_cast<QQuickWindow*>(engine.rootObjects().first());
+    if (window) {
+        // frameSwapped comes from the render thread, so queue it explicitly
+        const auto firstFrameOnly = static_cast<Qt::ConnectionType>(Qt::QueuedConnection | Qt::SingleShotConnection);
+        if (profileStartup) {
+            // Read the timer on the render thread, at the swap itself, so the
+            // total does not include the hop back to the GUI thread
+            QObject::connect(window, &QQuickWindow::frameSwapped,
+                             &app, [startupTimer]() {
+                qInfo().nospace() << "[startup] first frame: " << startupTimer.elapsed() << " ms total";
+            }, static_cast<Qt::ConnectionType>(Qt::DirectConnection | Qt::SingleShotConnection));
+        }
+        QObject::connect(window, &QQuickWindow::frameSwapped,
+                         screenGrabber, startCapture, firstFrameOnly);
+    }
     
     return app.exec();
-}
\ No newline at end of file
+}
@@ -38,14 +38,7 @@ Item {
             x: 500
             y: 150
             // Change title to show different type
-            Text {
-                text: "Process: Filter"
-                color: "white"
-                font.pixelSize: 12
-                anchors.centerIn: parent
-                font.bold: true
-                z: 1
-            }
+            title: "Process: Filter"
         }
     }
     
@@ -60,14 +53,8 @@ Item {
         drag.minimumY: -parent.height
         drag.maximumY: 0
         
-        // Handle panning with mouse
-        onPressed: {
-            // Capture the initial position for panning
-        }
-        
-        onPositionChanged: {
-            // Update the world position based on mouse movement
-        }
+        // Panning is handled entirely by drag.target; no per-move handlers,
+        // so mouse motion never calls into JavaScript
     }
     
     // Optional zoom functionality (structure ready)
@@ -14,31 +14,33 @@ Item {
     Canvas {
         anchors.fill: parent
         onPaint: {
-            var ctx = canvas.context
+            var ctx = getContext("2d")
             ctx.reset()
             
             // Set grid properties
             var gridSize = 20
             var lineColor = "#3e3e3e"
             
-            // Draw vertical lines
             ctx.strokeStyle = lineColor
             ctx.lineWidth = 1
             
+            // Collect every grid line into a single path and stroke it once,
+            // instead of a beginPath/stroke pair per line
+            ctx.beginPath()
+            
+            // Vertical lines
             for (var x = 0; x < width; x += gridSize) {
-                ctx.beginPath()
                 ctx.moveTo(x, 0)
                 ctx.lineTo(x, height)
-                ctx.stroke()
             }
             
-            // Draw horizontal lines
+            // Horizontal lines
             for (var y = 0; y < height; y += gridSize) {
-                ctx.beginPath()
                 ctx.moveTo(0, y)
                 ctx.lineTo(width, y)
-                ctx.stroke()
             }
+            
+            ctx.stroke()
         }
         
         onWidthChanged: requestPaint()
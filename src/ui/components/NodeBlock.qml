@@ -6,6 +6,9 @@ Item {
     width: 160
     height: 80
     
+    // Header text, set per node instead of layering extra Text items on top
+    property alias title: titleText.text
+    
     // Main rectangle with rounded corners
     Rectangle {
         id: blockRect
@@ -45,7 +48,7 @@ Item {
             color: "#4caf50"  // Green for input
             anchors.left: parent.left
             anchors.leftMargin: -6
-            anchors.verticalCenter: parent.height / 2
+            anchors.verticalCenter: parent.verticalCenter
             
             // Add a border to make it more visible
             border.color: "white"
@@ -61,7 +64,7 @@ Item {
             color: "#ff9800"  // Orange for output
             anchors.right: parent.right
             anchors.rightMargin: -6
-            anchors.verticalCenter: parent.height / 2
+            anchors.verticalCenter: parent.verticalCenter
             
             // Add a border to make it more visible
             border.color: "white"